@@ -26,6 +26,9 @@ class EmbeddingConfig(BaseModel):
     provider: Literal["huggingface", "openai"] = "huggingface"
     huggingface: HuggingFaceConfig = Field(default_factory=HuggingFaceConfig)
     openai: OpenAIConfig = Field(default_factory=OpenAIConfig)
+    dedupe_cache: bool = True
+    dedupe_cache_size: int = Field(default=4096, ge=0, le=1_000_000)
+    persistent_cache: bool = False
 
 
 class QdrantConfig(BaseModel):
@@ -42,6 +45,7 @@ class QdrantConfig(BaseModel):
     prefetch_ratio_sparse: float = Field(default=3.0, ge=0.5, le=10.0)
 
     upsert_batch_size: int = Field(default=100, ge=10, le=1000)
+    vector_dtype: Literal["float32", "float16", "int8"] = "float32"
     enable_performance_logging: bool = False
 
     @field_validator("url")
@@ -67,6 +71,8 @@ class ParsingConfig(BaseModel):
     timeout_micros: int = Field(default=5_000_000, ge=100_000, le=30_000_000)
     enable_error_recovery: bool = True
     partial_parse_threshold: float = Field(default=0.5, ge=0.0, le=1.0)
+    max_reference_nodes: int = Field(default=100_000, ge=1_000, le=10_000_000)
+    enable_extraction_cache: bool = False
     enable_chunking: bool = True
     chunking_threshold_lines: int = Field(default=1000, ge=100, le=10000)
     chunking_threshold_bytes: int = Field(default=50_000, ge=10_000, le=1_000_000)
@@ -115,6 +121,8 @@ class IndexingConfig(BaseModel):
     )
     max_file_size_mb: int = Field(default=10, ge=1, le=100)
     parallel_workers: int = Field(default=0, ge=0, le=16)
+    storage_concurrency: int = Field(default=4, ge=1, le=16)
+    checksum_workers: int = Field(default=0, ge=0, le=64)
     field_weights: FieldWeights = Field(default_factory=FieldWeights)
     memory: MemoryConfig = Field(default_factory=MemoryConfig)
     parsing: ParsingConfig = Field(default_factory=ParsingConfig)
@@ -72,6 +72,10 @@ def load_from_env() -> dict[str, Any]:
     if model := os.getenv("CODECONTEXT_MODEL"):
         config.setdefault("embeddings", {}).setdefault("huggingface", {})["model_name"] = model
 
+    if max_nodes := os.getenv("CODECONTEXT_MAX_NODES"):
+        parsing = config.setdefault("indexing", {}).setdefault("parsing", {})
+        parsing["max_reference_nodes"] = int(max_nodes)
+
     if port := os.getenv("CODECONTEXT_PORT"):
         config.setdefault("storage", {})["port"] = int(port)
 
@@ -58,6 +58,7 @@ class ParserConfig:
     enable_incremental_parsing: bool = False
     enable_performance_monitoring: bool = False
     language_overrides: dict[str, dict[str, int]] = field(default_factory=dict)
+    max_reference_nodes: int = 100_000  # Skip the reference walk above this tree size
 
     def get_timeout_for_language(self, language: str) -> int:
         """Get timeout for specific language, with override support."""
@@ -277,14 +278,30 @@ class TreeSitterParser:
         Returns:
             Parsed AST tree (may contain ERROR nodes if partial parse)
 
+        Raises:
+            ParserError: If parsing fails or partial parse quality too low
+        """
+        return self.parse_bytes(bytes(source_code, "utf8"))
+
+    def parse_bytes(self, source_bytes: bytes) -> Tree:
+        """
+        Parse UTF-8 encoded source code into an AST with error handling.
+
+        Tree-sitter works on bytes, so callers that already hold the encoded
+        source avoid a decode/encode round-trip.
+
+        Args:
+            source_bytes: Source code as UTF-8 bytes
+
+        Returns:
+            Parsed AST tree (may contain ERROR nodes if partial parse)
+
         Raises:
             ParserError: If parsing fails or partial parse quality too low
         """
         start_time = time.time() if self.config.enable_performance_monitoring else None
 
         try:
-            source_bytes = bytes(source_code, "utf8")
-
             # Parse with optional incremental support
             if self.config.enable_incremental_parsing and self.previous_tree:
                 tree = self.parser.parse(source_bytes, old_tree=self.previous_tree)
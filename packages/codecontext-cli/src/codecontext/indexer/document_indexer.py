@@ -1,11 +1,14 @@
 """Document indexer for markdown section extraction."""
 
 import re
+import string
+from collections.abc import Iterator
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarkdownSection:
     """Represents a markdown section split by headers."""
 
@@ -17,42 +20,128 @@ class MarkdownSection:
     parent_title: str | None = None
 
 
+# Anchored at line starts; [^\S\n] keeps the match on one line
+_HEADER_RE = re.compile(r"^(#{2,6})[^\S\n]+(.+)$", re.MULTILINE)
+
+# Both reference patterns start with a literal ("`" or "."), which lets the
+# regex engine jump between candidates instead of trying every position
+_CODE_REF_RE = re.compile(r"`([A-Z][a-zA-Z0-9.]+)`")
+_FILE_EXT_RE = re.compile(r"\.(?:py|kt|java|ts|js|tsx|jsx)")
+_PATH_CHARS = frozenset(string.ascii_letters + "_/")
+_MAX_PATH_LENGTH = 128
+
+
+def _find_file_references(content: str) -> list[str]:
+    """Find file path references such as ``path/to/file.py``.
+
+    Equivalent to scanning for ``[a-zA-Z_/]{1,128}\\.(py|kt|...)`` from the start
+    of each path run, but anchored on the extension: the path is recovered by
+    walking back from each matched dot, so no input can trigger backtracking.
+    Runs longer than the cap are not reported.
+    """
+    names = []
+    path_end = 0
+
+    for match in _FILE_EXT_RE.finditer(content):
+        start = dot = match.start()
+        while start > path_end and content[start - 1] in _PATH_CHARS:
+            start -= 1
+            if dot - start > _MAX_PATH_LENGTH:
+                break
+        if 0 < dot - start <= _MAX_PATH_LENGTH:
+            names.append(content[start : match.end()])
+            path_end = match.end()
+
+    return names
+
+
+def _iter_header_matches(content: str) -> Iterator[re.Match[str]]:
+    """Yield ATX header matches, running the regex only on lines starting with ##.
+
+    str.find jumps straight to candidate line starts, which is several times
+    faster than letting a multiline regex step through every position.
+    """
+    line_start = 0
+    while True:
+        if content.startswith("##", line_start):
+            match = _HEADER_RE.match(content, line_start)
+            if match:
+                yield match
+
+        newline = content.find("\n##", line_start)
+        if newline == -1:
+            return
+        line_start = newline + 1
+
+
+def _scan_headers(content: str) -> list[tuple[int, int, int, str]]:
+    """Locate header sections as ``(start, end, depth, title)`` tuples.
+
+    ``content[start:end]`` is a section's text including its header line; a
+    section stops right before the newline preceding the next header. Scanning
+    is kept apart from section building so the scan can be replaced by a
+    native implementation without touching callers.
+    """
+    spans = []
+    previous: tuple[int, int, str] | None = None
+
+    for match in _iter_header_matches(content):
+        if previous:
+            spans.append((previous[0], match.start() - 1, previous[1], previous[2]))
+        previous = (match.start(), match.end(1) - match.start(1), match.group(2).strip())
+
+    if previous:
+        spans.append((previous[0], len(content), previous[1], previous[2]))
+
+    return spans
+
+
+def _iter_section_fields(content: str) -> Iterator[tuple[str, str, int, int, int]]:
+    """Yield ``(title, content, start_line, end_line, depth)`` per header section."""
+    spans = _scan_headers(content)
+    if not spans:
+        return
+
+    start_line = content.count("\n", 0, spans[0][0]) + 1
+    for start, end, depth, title in spans:
+        section_content = content[start:end]
+        end_line = start_line + section_content.count("\n")
+        yield title, section_content, start_line, end_line, depth
+        start_line = end_line + 1
+
+
+@lru_cache(maxsize=4096)
+def _scan_code_references(content: str) -> tuple[tuple[str, str, str], ...]:
+    """Scan content for references, memoized for re-indexed (unchanged) chunks.
+
+    Returns immutable (name, type, match_reason) tuples so cached results cannot
+    be mutated through the dictionaries handed out to callers.
+    """
+    code_refs = tuple(
+        (match.group(1), "code_ref", "backtick reference")
+        for match in _CODE_REF_RE.finditer(content)
+    )
+    file_refs = tuple(
+        (name, "file_ref", "file reference") for name in _find_file_references(content)
+    )
+    return code_refs + file_refs
+
+
 class DocumentIndexer:
     """Indexes markdown documents by splitting into sections."""
 
     def split_by_headers(self, content: str, _file_path: str) -> list[MarkdownSection]:
         """Split markdown by ATX headers (##, ###)."""
-        sections = []
-        lines = content.split("\n")
-
-        current_section = None
-        current_content = []
-
-        for i, line in enumerate(lines):
-            header_match = re.match(r"^(#{2,6})\s+(.+)$", line)
-
-            if header_match:
-                if current_section:
-                    current_section.content = "\n".join(current_content)
-                    current_section.end_line = i
-                    sections.append(current_section)
-
-                depth = len(header_match.group(1))
-                title = header_match.group(2).strip()
-
-                current_section = MarkdownSection(
-                    title=title, content="", start_line=i + 1, end_line=i + 1, depth=depth
-                )
-                current_content = [line]
-            elif current_section:
-                current_content.append(line)
-
-        if current_section:
-            current_section.content = "\n".join(current_content)
-            current_section.end_line = len(lines)
-            sections.append(current_section)
-
-        return sections
+        return [
+            MarkdownSection(
+                title=title,
+                content=section_content,
+                start_line=start_line,
+                end_line=end_line,
+                depth=depth,
+            )
+            for title, section_content, start_line, end_line, depth in _iter_section_fields(content)
+        ]
 
     def extract_code_references(self, content: str) -> list[dict[str, Any]]:
         """Extract code references from markdown content.
@@ -69,18 +158,7 @@ class DocumentIndexer:
         Returns:
             List of dictionaries with 'name', 'type', and 'match_reason' keys
         """
-        references = []
-
-        backtick_pattern = r"`([A-Z][a-zA-Z0-9.]+)`"
-        for match in re.finditer(backtick_pattern, content):
-            references.append(
-                {"name": match.group(1), "type": "code_ref", "match_reason": "backtick reference"}
-            )
-
-        file_pattern = r"([a-zA-Z_/]+\.(py|kt|java|ts|js|tsx|jsx))"
-        for match in re.finditer(file_pattern, content):
-            references.append(
-                {"name": match.group(1), "type": "file_ref", "match_reason": "file reference"}
-            )
-
-        return references
+        return [
+            {"name": name, "type": ref_type, "match_reason": match_reason}
+            for name, ref_type, match_reason in _scan_code_references(content)
+        ]
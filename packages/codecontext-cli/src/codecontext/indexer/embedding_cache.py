@@ -0,0 +1,107 @@
+"""Cache of embeddings keyed by the embedded text.
+
+Repositories repeat a lot of text (boilerplate constructors, license headers,
+generated accessors). Keying embeddings by a hash of the exact text sent to the
+model lets an indexing run embed each distinct text once. With a database path,
+embeddings are also kept in SQLite per model, so later runs reuse them too.
+"""
+
+import sqlite3
+from array import array
+from collections import OrderedDict
+from pathlib import Path
+
+import xxhash
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS embeddings "
+    "(model TEXT, key BLOB, embedding BLOB, PRIMARY KEY (model, key))"
+)
+
+
+class EmbeddingCache:
+    """Least-recently-used map from text hash to embedding.
+
+    Embeddings are held as float32 arrays (4 bytes per dimension rather than a
+    boxed float per dimension). Entries missing from memory are looked up in the
+    optional SQLite database, where they are stored as float32 under the model id.
+    """
+
+    def __init__(self, maxsize: int, path: Path | None = None, model_id: str = "") -> None:
+        """Create an empty cache.
+
+        Args:
+            maxsize: Maximum number of embeddings kept in memory; 0 disables memory storage
+            path: SQLite database for embeddings kept across runs (None = memory only)
+            model_id: Identifies the model that produced the embeddings in the database
+        """
+        self.maxsize = maxsize
+        self.model_id = model_id
+        self._entries: OrderedDict[bytes, array[float]] = OrderedDict()
+        self._conn: sqlite3.Connection | None = None
+        if path is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(path, timeout=30.0)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+
+    @staticmethod
+    def key_for(text: str) -> bytes:
+        """Build the cache key for the exact text sent to the model."""
+        return xxhash.xxh3_128_digest(text.encode("utf-8"))
+
+    def get(self, key: bytes) -> list[float] | None:
+        """Return the cached embedding and mark it recently used, or None on a miss."""
+        stored = self._entries.get(key)
+        if stored is not None:
+            self._entries.move_to_end(key)
+            return stored.tolist()
+
+        if self._conn is None:
+            return None
+        row = self._conn.execute(
+            "SELECT embedding FROM embeddings WHERE model = ? AND key = ?", (self.model_id, key)
+        ).fetchone()
+        if row is None:
+            return None
+
+        stored = array("f")
+        stored.frombytes(row[0])
+        self._remember(key, stored)
+        return stored.tolist()
+
+    def put(self, key: bytes, embedding: list[float]) -> None:
+        """Store an embedding; database writes are pending until commit()."""
+        stored = array("f", embedding)
+        self._remember(key, stored)
+        if self._conn is not None:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO embeddings (model, key, embedding) VALUES (?, ?, ?)",
+                (self.model_id, key, stored.tobytes()),
+            )
+
+    def commit(self) -> None:
+        """Write pending database entries."""
+        if self._conn is not None:
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Commit and close the database connection."""
+        if self._conn is not None:
+            self._conn.commit()
+            self._conn.close()
+            self._conn = None
+
+    def _remember(self, key: bytes, stored: "array[float]") -> None:
+        """Keep an embedding in memory, evicting the least recently used entry when full."""
+        if self.maxsize <= 0:
+            return
+        self._entries[key] = stored
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
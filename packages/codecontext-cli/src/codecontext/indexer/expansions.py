@@ -11,11 +11,15 @@ TYPE_KEYWORDS = {
     ObjectType.METHOD: ["procedure", "routine"],
 }
 
+# Keyword suffixes joined once at import instead of on every expansion. Every
+# ObjectType has an entry ("" without keywords), so expanding is one subscript
+# and one concatenation.
+_TYPE_SUFFIX = {
+    object_type: " " + " ".join(TYPE_KEYWORDS[object_type]) if object_type in TYPE_KEYWORDS else ""
+    for object_type in ObjectType
+}
+
 
 def expand_content(obj: CodeObject) -> str:
     """Add type-specific keywords to content for better discovery."""
-    keywords = TYPE_KEYWORDS.get(obj.object_type)
-    if not keywords:
-        return obj.content
-
-    return f"{obj.content} {' '.join(keywords)}"
+    return obj.content + _TYPE_SUFFIX[obj.object_type]
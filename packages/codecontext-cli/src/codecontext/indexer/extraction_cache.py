@@ -0,0 +1,116 @@
+"""Persistent cache of per-file extraction results.
+
+Stores pickled ExtractionResult objects in SQLite keyed by a hash of the file
+path, its content, the cache format version and the installed tree-sitter and
+grammar versions, so unchanged files skip tree-sitter parsing and every
+relationship query on warm runs.
+"""
+
+import logging
+import pickle
+import sqlite3
+from collections.abc import Iterator
+from contextlib import contextmanager
+from importlib import metadata
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import xxhash
+
+if TYPE_CHECKING:
+    from codecontext.indexer.extractor import ExtractionResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when extraction output changes so stale entries are never served
+EXTRACTION_CACHE_VERSION = "3"
+
+_SCHEMA = "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, blob BLOB)"
+
+# Parser and grammar upgrades change syntax trees, so their versions are keyed too
+_PARSER_PACKAGES = ("tree-sitter", "tree-sitter-language-pack")
+
+
+def _parser_versions() -> str:
+    versions = []
+    for package in _PARSER_PACKAGES:
+        try:
+            versions.append(f"{package}={metadata.version(package)}")
+        except metadata.PackageNotFoundError:
+            versions.append(f"{package}=unknown")
+    return ",".join(versions)
+
+
+_PARSER_VERSIONS = _parser_versions()
+
+
+class ExtractionCache:
+    """SQLite-backed cache of ExtractionResult objects.
+
+    The database runs in WAL mode so concurrent indexing runs can read while
+    one of them writes.
+    """
+
+    def __init__(self, path: Path, version: str = EXTRACTION_CACHE_VERSION) -> None:
+        """Open (or create) the cache database.
+
+        Args:
+            path: SQLite database file
+            version: Extraction format version mixed into every key
+        """
+        self.path = path
+        self.version = version
+        self._key_prefix = f"{version}\0{_PARSER_VERSIONS}\0".encode()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(path, timeout=30.0)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._batch_depth = 0
+
+    def key_for(self, file_path: str, content: str | bytes) -> str:
+        """Build the cache key for a file's content (text or UTF-8 bytes)."""
+        digest = xxhash.xxh3_128(self._key_prefix)
+        digest.update(f"{file_path}\0".encode())
+        digest.update(content.encode("utf-8") if isinstance(content, str) else content)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> "ExtractionResult | None":
+        """Load a cached result, or None on a miss or unreadable entry."""
+        row = self._conn.execute("SELECT blob FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        try:
+            result: ExtractionResult = pickle.loads(row[0])
+        except (pickle.UnpicklingError, AttributeError, EOFError, ImportError) as e:
+            logger.debug(f"Discarding unreadable extraction cache entry {key}: {e}")
+            return None
+        return result
+
+    def put(self, key: str, result: "ExtractionResult") -> None:
+        """Store a result under key."""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO results (key, blob) VALUES (?, ?)",
+            (key, pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)),
+        )
+        self._commit()
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group every write made inside the block into a single commit."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            self._commit()
+
+    def _commit(self) -> None:
+        if self._batch_depth == 0:
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -1,13 +1,23 @@
 import asyncio
+import bisect
 import logging
-from collections.abc import AsyncGenerator
+import re
+from collections import deque
+from collections.abc import Mapping
+from contextlib import AbstractContextManager, nullcontext
 from dataclasses import dataclass, field
+from functools import cache
 from pathlib import Path
+from types import MappingProxyType
 from typing import TYPE_CHECKING, cast
 
+from codecontext_core.exceptions import UnsupportedLanguageError
 from codecontext_core.models import CodeObject, Relationship, RelationType
+from codecontext_core.models import Language as LanguageEnum
 from tree_sitter import Language, Node, Query, QueryCursor, Tree
 
+from codecontext.indexer.ast_parser import ParserConfig
+from codecontext.indexer.extraction_cache import ExtractionCache
 
 if TYPE_CHECKING:
     from codecontext.parsers.base import BaseCodeParser
@@ -15,6 +25,126 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_CAPTURE_RE = re.compile(r"@[\w.]+")
+
+# Call sites are reported as CALLS, so references directly under them are skipped
+_CALL_NODE_TYPES = frozenset({"call", "call_expression"})
+
+# Objects by UTF-8 name; a name shared by several objects maps to a list of them
+_NameMap = dict[bytes, CodeObject | list[CodeObject]]
+
+# Node types whose name identifies the object a reference or call belongs to
+_CONTEXT_NODE_TYPES = frozenset(
+    {
+        "function_definition",
+        "method",
+        "method_definition",
+        "function_declaration",
+        "method_declaration",
+        "class_definition",
+        "class_declaration",
+    }
+)
+
+
+# Query patterns per language. Frozen and shared by every Extractor; tuples so
+# they key the module-level query caches directly.
+_CALL_PATTERNS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "python": (
+            "(call function: (identifier) @callee)",
+            "(call function: (attribute) @callee)",
+        ),
+        "javascript": (
+            "(call_expression function: (identifier) @callee)",
+            "(call_expression function: (member_expression) @callee)",
+        ),
+        "typescript": (
+            "(call_expression function: (identifier) @callee)",
+            "(call_expression function: (member_expression) @callee)",
+        ),
+    }
+)
+
+_INHERITANCE_PATTERNS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "python": (
+            "(class_definition superclasses: (argument_list (identifier) @parent))",
+            "(class_definition superclasses: (argument_list (attribute) @parent))",
+        ),
+        "javascript": ("(class_declaration superclass: (identifier) @parent)",),
+        "typescript": ("(extends_clause (identifier) @parent)",),
+    }
+)
+
+_INTERFACE_PATTERNS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "typescript": ("(implements_clause (type_identifier) @interface)",),
+        "java": (
+            "(class_declaration interfaces: (super_interfaces (type_list (type_identifier) @interface)))",
+        ),
+        "kotlin": (
+            "(class_declaration (delegation_specifier (user_type (type_identifier) @interface)))",
+        ),
+    }
+)
+
+_IMPORT_PATTERNS: Mapping[str, tuple[str, ...]] = MappingProxyType(
+    {
+        "python": (
+            "(import_statement name: (dotted_name) @imported)",
+            "(import_from_statement module_name: (dotted_name) @imported)",
+            "(import_from_statement name: (dotted_name (identifier) @imported))",
+        ),
+        "javascript": (
+            "(import_statement source: (string) @imported)",
+            "(import_statement source: (string (string_fragment) @imported))",
+        ),
+        "typescript": (
+            "(import_statement source: (string) @imported)",
+            "(import_statement source: (string (string_fragment) @imported))",
+        ),
+        "java": (
+            "(import_declaration (scoped_identifier) @imported)",
+            "(import_declaration (identifier) @imported)",
+        ),
+        "kotlin": ("(import_header (identifier) @imported)",),
+    }
+)
+
+# References are found by walking the tree (see Extractor._walk_tree), not by query
+_REFERENCE_NODE_TYPES: Mapping[str, frozenset[str]] = MappingProxyType(
+    {
+        "python": frozenset({"identifier", "attribute"}),
+        "javascript": frozenset({"identifier", "member_expression"}),
+        "typescript": frozenset({"identifier", "member_expression"}),
+    }
+)
+
+
+def _combine_relationship_patterns() -> Mapping[str, tuple[str, ...]]:
+    """Merge call, inheritance and interface patterns into one set per language.
+
+    Each capture is renamed to its relation type, so one multi-pattern query
+    finds every relationship kind in a single walk of the tree.
+    """
+    pattern_map = (
+        (_CALL_PATTERNS, RelationType.CALLS),
+        (_INHERITANCE_PATTERNS, RelationType.EXTENDS),
+        (_INTERFACE_PATTERNS, RelationType.IMPLEMENTS),
+    )
+
+    combined: dict[str, list[str]] = {}
+    for patterns, rel_type in pattern_map:
+        for language, language_patterns in patterns.items():
+            combined.setdefault(language, []).extend(
+                _CAPTURE_RE.sub(f"@{rel_type.value}", pattern) for pattern in language_patterns
+            )
+    return MappingProxyType({language: tuple(p) for language, p in combined.items()})
+
+
+_RELATIONSHIP_PATTERNS = _combine_relationship_patterns()
+
 
 @dataclass
 class ImportInfo:
@@ -29,121 +159,209 @@ class ExtractionResult:
     imports: list[ImportInfo] = field(default_factory=list)
 
 
+@dataclass(slots=True)
+class _TargetIndex:
+    """Same-named candidates sorted by start line, for nearest-target lookups.
+
+    Candidate 0 stays out of the sorted lines because target selection scores
+    it by the source object's distance rather than its own line.
+    """
+
+    lines: list[int]
+    first: list[int]
+    shared_id: str | None
+
+    @classmethod
+    def build(cls, candidates: list[CodeObject]) -> "_TargetIndex":
+        lines: list[int] = []
+        first: list[int] = []
+        for i in sorted(range(1, len(candidates)), key=lambda i: (candidates[i].start_line, i)):
+            line = candidates[i].start_line
+            if not lines or lines[-1] != line:
+                lines.append(line)
+                first.append(i)
+
+        ids = {obj.deterministic_id for obj in candidates}
+        return cls(lines, first, ids.pop() if len(ids) == 1 else None)
+
+    def nearest(self, ref_line: int, first_distance: int) -> int:
+        """Index of the candidate closest to ref_line; candidate 0 scores first_distance."""
+        best, best_distance = 0, first_distance
+        pos = bisect.bisect_left(self.lines, ref_line)
+        # Only the lines either side of ref_line can be closest; on equal
+        # distance the earlier candidate wins, as in a linear scan
+        for i in (pos - 1, pos):
+            if 0 <= i < len(self.lines):
+                distance = abs(self.lines[i] - ref_line)
+                if distance < best_distance or (distance == best_distance and self.first[i] < best):
+                    best, best_distance = self.first[i], distance
+        return best
+
+
+@cache
+def _compile_query(ts_language: Language, pattern: str) -> Query | None:
+    """Compile a query once per process, shared by every Extractor.
+
+    Language objects for the same grammar compare and hash equal, so parsers
+    from different factories hit the same entries.
+    """
+    try:
+        return Query(ts_language, pattern)
+    except (ValueError, RuntimeError) as e:
+        logger.debug(f"Invalid query pattern for language: {pattern[:50]}... Error: {e}")
+        return None
+
+
+@cache
+def _compile_combined_query(ts_language: Language, patterns: tuple[str, ...]) -> Query | None:
+    """Compile a language's patterns into one multi-pattern query, once per process."""
+    query = _compile_query(ts_language, "\n".join(patterns))
+    if query is not None:
+        return query
+
+    # A single pattern the grammar rejects invalidates the whole query
+    valid = [p for p in patterns if _compile_query(ts_language, p) is not None]
+    if not valid:
+        return None
+    return _compile_query(ts_language, "\n".join(valid))
+
+
+# Idle cursors per compiled query, keyed by id(query) (queries live as long as _compile_query)
+_cursor_pool: dict[int, deque[QueryCursor]] = {}
+
+
+def _run_captures(query: Query, node: Node) -> dict[str, list[Node]]:
+    """Run a query with a pooled cursor, creating one only if none is idle."""
+    pool = _cursor_pool.setdefault(id(query), deque())
+    try:
+        cursor = pool.popleft()
+    except IndexError:
+        cursor = QueryCursor(query)
+    try:
+        return cursor.captures(node)
+    finally:
+        pool.appendleft(cursor)
+
+
+@dataclass(slots=True)
+class _ContextIndex:
+    """Byte ranges of a file's context nodes in preorder, for ancestor lookups.
+
+    Context nodes nest without overlapping, so the innermost one containing a
+    node is found by bisecting on start offsets and following parent links,
+    instead of walking node.parent for every reference.
+    """
+
+    starts: list[int] = field(default_factory=list)
+    ends: list[int] = field(default_factory=list)
+    parents: list[int] = field(default_factory=list)
+    contexts: list[CodeObject | None] = field(default_factory=list)
+
+    def add(self, node: Node, context: CodeObject | None) -> None:
+        start, end = node.start_byte, node.end_byte
+        parent = len(self.starts) - 1
+        while parent >= 0 and self.ends[parent] < end:
+            parent = self.parents[parent]
+        self.starts.append(start)
+        self.ends.append(end)
+        self.parents.append(parent)
+        self.contexts.append(context)
+
+    def find(self, node: Node) -> CodeObject | None:
+        end = node.end_byte
+        i = bisect.bisect_right(self.starts, node.start_byte) - 1
+        while i >= 0 and self.ends[i] < end:
+            i = self.parents[i]
+        return self.contexts[i] if i >= 0 else None
+
+
+def _read_source(file_path: str) -> bytes:
+    """Read a file with line endings translated to \\n, as text mode reads do."""
+    return Path(file_path).read_bytes().replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+
+
 class Extractor:
-    def __init__(self, parser_factory: "ParserFactory") -> None:
+    def __init__(
+        self, parser_factory: "ParserFactory", cache: ExtractionCache | None = None
+    ) -> None:
         self.parser_factory = parser_factory
-        self._init_patterns()
-        self._query_cache: dict[tuple[int, str], QueryCursor | None] = {}
-
-    def _init_patterns(self) -> None:
-        self.call_patterns = {
-            "python": [
-                "(call function: (identifier) @callee)",
-                "(call function: (attribute) @callee)",
-            ],
-            "javascript": [
-                "(call_expression function: (identifier) @callee)",
-                "(call_expression function: (member_expression) @callee)",
-            ],
-            "typescript": [
-                "(call_expression function: (identifier) @callee)",
-                "(call_expression function: (member_expression) @callee)",
-            ],
-        }
-
-        self.reference_patterns = {
-            "python": [
-                "(identifier) @ref",
-                "(attribute) @ref",
-            ],
-            "javascript": [
-                "(identifier) @ref",
-                "(member_expression) @ref",
-            ],
-            "typescript": [
-                "(identifier) @ref",
-                "(member_expression) @ref",
-            ],
-        }
-
-        self.inheritance_patterns = {
-            "python": [
-                "(class_definition superclasses: (argument_list (identifier) @parent))",
-                "(class_definition superclasses: (argument_list (attribute) @parent))",
-            ],
-            "javascript": [
-                "(class_declaration superclass: (identifier) @parent)",
-            ],
-            "typescript": [
-                "(extends_clause (identifier) @parent)",
-            ],
-        }
-
-        self.interface_patterns = {
-            "typescript": [
-                "(implements_clause (type_identifier) @interface)",
-            ],
-            "java": [
-                "(class_declaration interfaces: (super_interfaces (type_list (type_identifier) @interface)))",
-            ],
-            "kotlin": [
-                "(class_declaration (delegation_specifier (user_type (type_identifier) @interface)))",
-            ],
-        }
-
-        self.import_patterns = {
-            "python": [
-                "(import_statement name: (dotted_name) @imported)",
-                "(import_from_statement module_name: (dotted_name) @imported)",
-                "(import_from_statement name: (dotted_name (identifier) @imported))",
-            ],
-            "javascript": [
-                "(import_statement source: (string) @imported)",
-                "(import_statement source: (string (string_fragment) @imported))",
-            ],
-            "typescript": [
-                "(import_statement source: (string) @imported)",
-                "(import_statement source: (string (string_fragment) @imported))",
-            ],
-            "java": [
-                "(import_declaration (scoped_identifier) @imported)",
-                "(import_declaration (identifier) @imported)",
-            ],
-            "kotlin": [
-                "(import_header (identifier) @imported)",
-            ],
-        }
+        self._cache = cache
+        parser_config = parser_factory.parser_config or ParserConfig()
+        self._max_reference_nodes = parser_config.max_reference_nodes
+        self._warm_queries()
+
+    def _warm_queries(self) -> None:
+        # Compile every language's queries up front so the first file of each
+        # language does not pay for query compilation
+        for language in _RELATIONSHIP_PATTERNS.keys() | _IMPORT_PATTERNS.keys():
+            try:
+                ts_language = self.parser_factory.get_ts_language(LanguageEnum(language))
+            except (UnsupportedLanguageError, ValueError) as e:
+                logger.debug(f"Skipping query warm-up for {language}: {e}")
+                continue
+
+            if language in _RELATIONSHIP_PATTERNS:
+                _compile_combined_query(ts_language, _RELATIONSHIP_PATTERNS[language])
+            if language in _IMPORT_PATTERNS:
+                _compile_combined_query(ts_language, _IMPORT_PATTERNS[language])
 
     async def extract_from_file(
-        self, file_path: str, content: str | None = None
+        self, file_path: str, content: str | bytes | None = None
     ) -> ExtractionResult:
-        if content is None:
-            content = Path(file_path).read_text(encoding="utf-8")
+        if content is not None:
+            return self._extract(file_path, content)
+
+        # Read off the event loop so concurrent extractions are not stalled on disk IO
+        source_bytes = await asyncio.to_thread(_read_source, file_path)
+        return self._extract(file_path, source_bytes)
+
+    def _extract(self, file_path: str, content: str | bytes) -> ExtractionResult:
+        if self._cache is None:
+            return self._extract_uncached(file_path, content)
+
+        key = self._cache.key_for(file_path, content)
+        result = self._cache.get(key)
+        if result is None:
+            result = self._extract_uncached(file_path, content)
+            self._cache.put(key, result)
+        return result
+
+    def batch_cache_writes(self) -> AbstractContextManager[None]:
+        """Commit extraction cache writes made inside the block together."""
+        return self._cache.batch() if self._cache is not None else nullcontext()
+
+    def _extract_uncached(self, file_path: str, content: str | bytes) -> ExtractionResult:
+        source_bytes = content.encode("utf-8") if isinstance(content, str) else content
 
         parser = self.parser_factory.get_parser(file_path)
         if not parser:
             return ExtractionResult(objects=[], relationships=[])
 
-        tree = parser.parser.parse_text(content)
+        tree = parser.parser.parse_bytes(source_bytes)
         if not tree:
             return ExtractionResult(objects=[], relationships=[])
 
-        source_bytes = content.encode("utf-8")
         base_parser = cast("BaseCodeParser", parser)
 
+        path = Path(file_path)
         objects = []
-        objects.extend(base_parser._extract_classes(tree, source_bytes, Path(file_path), file_path))
-        objects.extend(
-            base_parser._extract_interfaces(tree, source_bytes, Path(file_path), file_path)
-        )
-        objects.extend(
-            base_parser._extract_functions(tree, source_bytes, Path(file_path), file_path)
-        )
-        objects.extend(base_parser._extract_enums(tree, source_bytes, Path(file_path), file_path))
+        objects.extend(base_parser._extract_classes(tree, source_bytes, path, file_path))
+        objects.extend(base_parser._extract_interfaces(tree, source_bytes, path, file_path))
+        objects.extend(base_parser._extract_functions(tree, source_bytes, path, file_path))
+        objects.extend(base_parser._extract_enums(tree, source_bytes, path, file_path))
+
+        # Shared by relationship and CONTAINS extraction
+        id_map = {obj.deterministic_id: obj for obj in objects}
 
         if hasattr(parser, "language"):
             relationships = self._extract_relationships(
-                tree, file_path, parser.language, objects, parser.parser.ts_language
+                tree,
+                source_bytes,
+                file_path,
+                parser.language,
+                objects,
+                parser.parser.ts_language,
+                id_map,
             )
             imports = self._extract_imports(
                 tree, file_path, parser.language, parser.parser.ts_language
@@ -152,64 +370,117 @@ class Extractor:
             relationships = []
             imports = []
 
-        relationships.extend(self._extract_contains_relationships(objects))
+        relationships.extend(self._extract_contains_relationships(objects, id_map))
 
         return ExtractionResult(objects=objects, relationships=relationships, imports=imports)
 
-    async def extract_batch(
-        self, file_paths: list[str], batch_size: int = 100
-    ) -> AsyncGenerator[ExtractionResult, None]:
-        for i in range(0, len(file_paths), batch_size):
-            batch = file_paths[i : i + batch_size]
-            batch_objects = []
-            batch_relationships = []
-
-            tasks = [self.extract_from_file(path) for path in batch]
-            results = await asyncio.gather(*tasks)
-
-            for result in results:
-                batch_objects.extend(result.objects)
-                batch_relationships.extend(result.relationships)
-
-            yield ExtractionResult(objects=batch_objects, relationships=batch_relationships)
-
     def _extract_relationships(
         self,
         tree: Tree,
+        source: bytes,
         file_path: str,
         language: str,
         objects: list[CodeObject],
         ts_language: Language,
+        id_map: dict[str, CodeObject] | None = None,
     ) -> list[Relationship]:
         try:
             relationships = []
-            id_map: dict[str, CodeObject] = {obj.deterministic_id: obj for obj in objects}
-            name_map: dict[str, list[CodeObject]] = {}
+            # Repeated calls or references between the same pair are reported once
+            seen: set[tuple[str, str, RelationType]] = set()
+            if id_map is None:
+                id_map = {obj.deterministic_id: obj for obj in objects}
+            # Keyed by UTF-8 name so node text (bytes) is looked up without decoding
+            name_map: _NameMap = {}
 
             for obj in objects:
-                if obj.name not in name_map:
-                    name_map[obj.name] = []
-                name_map[obj.name].append(obj)
-
-            compiled_queries = self._compile_relationship_queries(ts_language, language)
-
-            for rel_type, cursor in compiled_queries:
+                name = obj.name.encode("utf-8")
+                existing = name_map.get(name)
+                if existing is None:
+                    name_map[name] = obj
+                elif isinstance(existing, list):
+                    existing.append(obj)
+                else:
+                    name_map[name] = [existing, obj]
+
+            target_indexes = {
+                name: _TargetIndex.build(objs)
+                for name, objs in name_map.items()
+                if isinstance(objs, list)
+            }
+
+            contexts: _ContextIndex | None = None
+            # Without a tree walk, contexts are found by walking up from each node;
+            # resolved definition nodes are remembered by Node.id
+            context_cache: dict[int, CodeObject | None] = {}
+            reference_nodes: list[Node] = []
+            if language in _REFERENCE_NODE_TYPES:
+                node_count = tree.root_node.descendant_count
+                if node_count > self._max_reference_nodes:
+                    # Generated or minified files would flood the walk with identifiers;
+                    # calls and inheritance are still found by the query below
+                    logger.warning(
+                        f"Skipping reference extraction for {file_path}: {node_count} nodes "
+                        f"exceeds max_reference_nodes={self._max_reference_nodes}"
+                    )
+                else:
+                    reference_nodes, contexts = self._walk_tree(
+                        tree, source, _REFERENCE_NODE_TYPES[language], name_map
+                    )
+
+            patterns = _RELATIONSHIP_PATTERNS.get(language)
+            query = _compile_combined_query(ts_language, patterns) if patterns else None
+            if query is not None:
                 try:
-                    captures_dict = cursor.captures(tree.root_node)
+                    captures_dict = _run_captures(query, tree.root_node)
+                except (ValueError, RuntimeError, OSError) as e:
+                    logger.warning(f"Relationship query execution failed for {file_path}: {e}")
+                    captures_dict = {}
 
-                    for _capture_name, nodes in captures_dict.items():
-                        for node in nodes:
-                            try:
-                                rel = self._create_relationship(node, rel_type, id_map, name_map)
-                                if rel:
+                for capture_name, nodes in captures_dict.items():
+                    rel_type = RelationType(capture_name)
+                    for node in nodes:
+                        try:
+                            rel = self._create_relationship(
+                                node,
+                                source,
+                                rel_type,
+                                id_map,
+                                name_map,
+                                contexts,
+                                target_indexes,
+                                context_cache,
+                            )
+                            if rel:
+                                key = (rel.source_id, rel.target_id, rel_type)
+                                if key not in seen:
+                                    seen.add(key)
                                     relationships.append(rel)
-                            except (ValueError, AttributeError, UnicodeDecodeError) as e:
-                                logger.debug(
-                                    f"Failed to create {rel_type.value} relationship: {e}",
-                                    exc_info=True,
-                                )
-                except (ValueError, RuntimeError, OSError) as e:
-                    logger.warning(f"Query execution failed for {rel_type.value}: {e}")
+                        except (ValueError, AttributeError, UnicodeDecodeError) as e:
+                            logger.debug(
+                                f"Failed to create {rel_type.value} relationship: {e}",
+                                exc_info=True,
+                            )
+
+            for node in reference_nodes:
+                try:
+                    rel = self._create_relationship(
+                        node,
+                        source,
+                        RelationType.REFERENCES,
+                        id_map,
+                        name_map,
+                        contexts,
+                        target_indexes,
+                        context_cache,
+                    )
+                    if rel:
+                        key = (rel.source_id, rel.target_id, RelationType.REFERENCES)
+                        if key not in seen:
+                            seen.add(key)
+                            relationships.append(rel)
+                except (ValueError, AttributeError, UnicodeDecodeError) as e:
+                    logger.debug(f"Failed to create references relationship: {e}", exc_info=True)
 
         except (ValueError, RuntimeError, OSError) as e:
             logger.error(f"Relationship extraction failed for {file_path}: {e}")
@@ -217,70 +488,84 @@ class Extractor:
         else:
             return relationships
 
-    def _compile_relationship_queries(
-        self, ts_language: Language, language: str
-    ) -> list[tuple[RelationType, QueryCursor]]:
-        compiled = []
-
-        pattern_map = [
-            (self.call_patterns, RelationType.CALLS),
-            (self.inheritance_patterns, RelationType.EXTENDS),
-            (self.interface_patterns, RelationType.IMPLEMENTS),
-            (self.reference_patterns, RelationType.REFERENCES),
-        ]
-
-        for patterns, rel_type in pattern_map:
-            if language in patterns:
-                for pattern in patterns[language]:
-                    cursor = self._compile_query_cached(ts_language, pattern)
-                    if cursor:
-                        compiled.append((rel_type, cursor))
-
-        return compiled
-
-    def _compile_query_cached(self, ts_language: Language, pattern: str) -> QueryCursor | None:
-        cache_key = (id(ts_language), pattern)
-        if cache_key not in self._query_cache:
-            try:
-                query = Query(ts_language, pattern)
-                self._query_cache[cache_key] = QueryCursor(query)
-            except (ValueError, RuntimeError) as e:
-                logger.debug(f"Invalid query pattern for language: {pattern[:50]}... Error: {e}")
-                self._query_cache[cache_key] = None
-        return self._query_cache[cache_key]
+    def _walk_tree(
+        self,
+        tree: Tree,
+        source: bytes,
+        reference_types: frozenset[str],
+        name_map: _NameMap,
+    ) -> tuple[list[Node], _ContextIndex]:
+        # One preorder walk collects reference candidates and indexes context nodes.
+        # Only nodes whose raw text names a known object are kept as references;
+        # a query capturing every identifier would materialize all of them. Text is
+        # sliced from the source, which is cheaper than Node.text.
+        references: list[Node] = []
+        contexts = _ContextIndex()
+
+        cursor = tree.walk()
+        while True:
+            node = cursor.node
+            if node is not None:
+                node_type = node.type
+                if node_type in _CONTEXT_NODE_TYPES:
+                    contexts.add(node, self._resolve_context(node, source, name_map))
+                elif (
+                    node_type in reference_types
+                    and source[node.start_byte : node.end_byte] in name_map
+                ):
+                    # Call sites are reported as CALLS by the relationship query
+                    parent = node.parent
+                    if parent is None or parent.type not in _CALL_NODE_TYPES:
+                        references.append(node)
+
+            if cursor.goto_first_child():
+                continue
+            while not cursor.goto_next_sibling():
+                if not cursor.goto_parent():
+                    return references, contexts
 
     def _create_relationship(
         self,
         node: Node,
+        source: bytes,
         rel_type: RelationType,
         id_map: dict[str, CodeObject],
-        name_map: dict[str, list[CodeObject]],
+        name_map: _NameMap,
+        contexts: _ContextIndex | None = None,
+        target_indexes: dict[bytes, _TargetIndex] | None = None,
+        context_cache: dict[int, CodeObject | None] | None = None,
     ) -> Relationship | None:
-        if node.text is None:
-            return None
-        target_name = node.text.decode("utf-8")
+        target_name = source[node.start_byte : node.end_byte]
 
-        if (
-            rel_type == RelationType.REFERENCES
-            and node.parent
-            and node.parent.type in ["call", "call_expression"]
-        ):
-            return None
-
-        source_obj = self._find_context(node, id_map, name_map)
+        if contexts is not None:
+            source_obj = contexts.find(node)
+        else:
+            source_obj = self._find_context(node, source, id_map, name_map, context_cache)
         if not source_obj:
             return None
 
-        target_objs = name_map.get(target_name, [])
-        if not target_objs:
+        targets = name_map.get(target_name)
+        if targets is None:
             return None
 
-        if rel_type == RelationType.REFERENCES and all(
-            obj.deterministic_id == source_obj.deterministic_id for obj in target_objs
-        ):
-            return None
+        if not isinstance(targets, list):
+            if (
+                rel_type == RelationType.REFERENCES
+                and targets.deterministic_id == source_obj.deterministic_id
+            ):
+                return None
+            target_obj: CodeObject | None = targets
+        else:
+            index = target_indexes.get(target_name) if target_indexes else None
+            if rel_type == RelationType.REFERENCES and (
+                index.shared_id == source_obj.deterministic_id
+                if index is not None
+                else all(obj.deterministic_id == source_obj.deterministic_id for obj in targets)
+            ):
+                return None
+
+            target_obj = self._select_best_target(node, source_obj, targets, index)
 
-        target_obj = self._select_best_target(node, source_obj, target_objs)
         if not target_obj:
             return None
 
@@ -299,40 +584,57 @@ class Extractor:
         )
 
     def _find_context(
-        self, node: Node, id_map: dict[str, CodeObject], name_map: dict[str, list[CodeObject]]
+        self,
+        node: Node,
+        source: bytes,
+        id_map: dict[str, CodeObject],
+        name_map: _NameMap,
+        context_cache: dict[int, CodeObject | None] | None = None,
     ) -> CodeObject | None:
         parent = node.parent
         while parent:
-            if parent.type in [
-                "function_definition",
-                "method",
-                "method_definition",
-                "function_declaration",
-                "method_declaration",
-                "class_definition",
-                "class_declaration",
-            ]:
-                context_name = self._find_name_node(parent)
-                if context_name and context_name in name_map:
-                    return self._select_best_context(parent, name_map[context_name])
-                break
+            if parent.type in _CONTEXT_NODE_TYPES:
+                if context_cache is None:
+                    return self._resolve_context(parent, source, name_map)
+                if parent.id not in context_cache:
+                    context_cache[parent.id] = self._resolve_context(parent, source, name_map)
+                return context_cache[parent.id]
             parent = parent.parent
 
         return None
 
+    def _resolve_context(
+        self, context_node: Node, source: bytes, name_map: _NameMap
+    ) -> CodeObject | None:
+        context_name = self._find_name_node(context_node, source)
+        if not context_name:
+            return None
+
+        candidates = name_map.get(context_name)
+        if isinstance(candidates, list):
+            return self._select_best_context(context_node, candidates)
+        return candidates
+
     def _select_best_target(
-        self, node: Node, source_obj: CodeObject, candidates: list[CodeObject]
+        self,
+        node: Node,
+        source_obj: CodeObject,
+        candidates: list[CodeObject],
+        index: _TargetIndex | None = None,
     ) -> CodeObject | None:
         if not candidates:
             return None
         if len(candidates) == 1:
             return candidates[0]
 
-        if not hasattr(node, "start_point"):
-            return candidates[0]
-
         ref_line = node.start_point[0] + 1
 
+        if index is not None:
+            # Same choice as the loop below: the first candidate is scored by the
+            # source's distance, and ties keep the earliest candidate
+            source_distance = abs(source_obj.start_line - ref_line)
+            return candidates[index.nearest(ref_line, source_distance)]
+
         best_obj = candidates[0]
         min_distance = abs(source_obj.start_line - ref_line)
 
@@ -350,56 +652,51 @@ class Extractor:
         if len(candidates) == 1:
             return candidates[0]
 
-        if hasattr(parent, "start_point"):
-            parent_start_line = parent.start_point[0] + 1
-            for obj in candidates:
-                if obj.start_line == parent_start_line:
-                    return obj
+        parent_start_line = parent.start_point[0] + 1
+        for obj in candidates:
+            if obj.start_line == parent_start_line:
+                return obj
 
         return candidates[0]
 
-    def _find_name_node(self, node: Node) -> str | None:
+    def _find_name_node(self, node: Node, source: bytes) -> bytes | None:
         name_node = node.child_by_field_name("name")
-        if name_node and name_node.text:
-            return name_node.text.decode("utf-8")
+        if name_node and name_node.end_byte > name_node.start_byte:
+            return source[name_node.start_byte : name_node.end_byte]
 
         for child in node.children:
-            if child.type == "identifier" and child.text is not None:
-                return child.text.decode("utf-8")
+            if child.type == "identifier":
+                return source[child.start_byte : child.end_byte]
         return None
 
-    def _extract_contains_relationships(self, objects: list[CodeObject]) -> list[Relationship]:
+    def _extract_contains_relationships(
+        self, objects: list[CodeObject], id_map: dict[str, CodeObject] | None = None
+    ) -> list[Relationship]:
         if not objects:
             return []
 
-        id_map: dict[str, CodeObject] = {obj.deterministic_id: obj for obj in objects}
-        relationships = []
-
-        for obj in objects:
-            if not obj.parent_deterministic_id:
-                continue
-
-            parent_obj = id_map.get(obj.parent_deterministic_id)
-            if not parent_obj:
-                continue
-
-            relationships.append(
-                Relationship(
-                    source_id=parent_obj.deterministic_id,
-                    source_name=parent_obj.name,
-                    source_type=parent_obj.object_type.value,
-                    source_file=parent_obj.relative_path,
-                    source_line=parent_obj.start_line,
-                    target_id=obj.deterministic_id,
-                    target_name=obj.name,
-                    target_type=obj.object_type.value,
-                    target_file=obj.relative_path,
-                    target_line=obj.start_line,
-                    relation_type=RelationType.CONTAINS,
-                )
+        if id_map is None:
+            id_map = {obj.deterministic_id: obj for obj in objects}
+        contains = RelationType.CONTAINS
+
+        return [
+            Relationship(
+                source_id=parent_obj.deterministic_id,
+                source_name=parent_obj.name,
+                source_type=parent_obj.object_type.value,
+                source_file=parent_obj.relative_path,
+                source_line=parent_obj.start_line,
+                target_id=obj.deterministic_id,
+                target_name=obj.name,
+                target_type=obj.object_type.value,
+                target_file=obj.relative_path,
+                target_line=obj.start_line,
+                relation_type=contains,
             )
-
-        return relationships
+            for obj in objects
+            if obj.parent_deterministic_id
+            and (parent_obj := id_map.get(obj.parent_deterministic_id))
+        ]
 
     def _extract_imports(
         self,
@@ -408,37 +705,35 @@ class Extractor:
         language: str,
         ts_language: Language,
     ) -> list[ImportInfo]:
-        if language not in self.import_patterns:
+        patterns = _IMPORT_PATTERNS.get(language)
+        if not patterns:
             return []
 
-        imports: list[ImportInfo] = []
-
-        for pattern in self.import_patterns[language]:
-            cursor = self._compile_query_cached(ts_language, pattern)
-            if not cursor:
-                continue
-
-            try:
-                captures_dict = cursor.captures(tree.root_node)
+        query = _compile_combined_query(ts_language, patterns)
+        if query is None:
+            return []
 
-                for _capture_name, nodes in captures_dict.items():
-                    for node in nodes:
-                        if node.text is None:
-                            continue
+        # One walk of the tree covers every import pattern of the language
+        try:
+            captures_dict = _run_captures(query, tree.root_node)
+        except (ValueError, RuntimeError, OSError) as e:
+            logger.debug(f"Failed to extract imports from {file_path}: {e}")
+            return []
 
-                        imported_name = node.text.decode("utf-8")
+        imports: list[ImportInfo] = []
+        for nodes in captures_dict.values():
+            for node in nodes:
+                if node.text is None:
+                    continue
 
-                        if imported_name.startswith(("'", '"')):
-                            imported_name = imported_name.strip("'\"")
+                imported_name = node.text.decode("utf-8")
 
-                        if not imported_name or imported_name in (".", "..", "/"):
-                            continue
+                if imported_name.startswith(("'", '"')):
+                    imported_name = imported_name.strip("'\"")
 
-                        imports.append(
-                            ImportInfo(imported_name=imported_name, source_file=file_path)
-                        )
+                if not imported_name or imported_name in (".", "..", "/"):
+                    continue
 
-            except (ValueError, RuntimeError, OSError) as e:
-                logger.debug(f"Failed to extract imports from {file_path}: {e}")
+                imports.append(ImportInfo(imported_name=imported_name, source_file=file_path))
 
         return imports
@@ -5,22 +5,22 @@ to ensure O(1) memory usage regardless of repository size.
 """
 
 import asyncio
-from collections.abc import AsyncGenerator
+import contextlib
+import logging
+import os
+from collections import defaultdict, deque
+from collections.abc import AsyncGenerator, Awaitable
 from pathlib import Path
-from typing import TYPE_CHECKING
 from uuid import UUID
 
+from codecontext_core import VectorStore
+from codecontext_core.exceptions import EmbeddingError
 from codecontext_core.interfaces import EmbeddingProvider, TranslationProvider
-from codecontext_core.models import CodeObject, DocumentNode, Relationship
+from codecontext_core.models import CodeObject, DocumentNode, Relationship, RelationType
+from codecontext_core.relationship_utils import create_reverse_relationship
 
 from codecontext.config.schema import Config
-
-if TYPE_CHECKING:
-    from codecontext.indexer.extractor import ImportInfo
-import logging
-
-from codecontext_core import VectorStore
-
+from codecontext.config.settings import get_data_dir
 from codecontext.indexer.chunking import (
     ChunkStats,
     MemoryManager,
@@ -29,11 +29,19 @@ from codecontext.indexer.chunking import (
 from codecontext.indexer.chunking import (
     chunk_files as iter_chunks,
 )
+from codecontext.indexer.embedding_cache import EmbeddingCache
+from codecontext.indexer.extraction_cache import EXTRACTION_CACHE_VERSION, ExtractionCache
+from codecontext.indexer.extractor import ExtractionResult, Extractor, ImportInfo
+from codecontext.parsers.factory import ParserFactory
 from codecontext.parsers.languages.config import ConfigFileParser
 from codecontext.parsers.languages.markdown import MarkdownParser
+from codecontext.utils.streaming_progress import SimpleProgress
 
 logger = logging.getLogger(__name__)
 
+# Maps a relative file path to a dotted module path
+_MODULE_PATH_TABLE = str.maketrans("/", ".")
+
 
 class AsyncIndexStrategy:
     """Memory-bounded chunked indexing strategy.
@@ -73,16 +81,46 @@ class AsyncIndexStrategy:
         else:
             self.language_detector = None
 
-        # Initialize parser factory and extractor
-        from codecontext.indexer.extractor import Extractor
-        from codecontext.parsers.factory import ParserFactory
+        # Identical texts are embedded once per run, and once per model with the
+        # persistent cache
+        embeddings_config = config.embeddings
+        self._embedding_cache: EmbeddingCache | None = None
+        if embeddings_config.dedupe_cache or embeddings_config.persistent_cache:
+            self._embedding_cache = EmbeddingCache(
+                embeddings_config.dedupe_cache_size if embeddings_config.dedupe_cache else 0,
+                get_data_dir() / "embedding_cache.db"
+                if embeddings_config.persistent_cache
+                else None,
+                self._embedding_model_id(),
+            )
 
-        self.parser_factory = ParserFactory.from_parsing_config(config.indexing.parsing)
-        self.extractor = Extractor(self.parser_factory)
+        # Initialize parser factory and extractor
+        parsing_config = config.indexing.parsing
+        self.parser_factory = ParserFactory.from_parsing_config(parsing_config)
+        # Parse settings change what gets extracted, so they are part of the key
+        extraction_cache_version = (
+            f"{EXTRACTION_CACHE_VERSION}:max_nodes={parsing_config.max_reference_nodes}"
+            f":partial={parsing_config.partial_parse_threshold}"
+            f":recovery={parsing_config.enable_error_recovery}"
+            f":timeout={parsing_config.timeout_micros}"
+            f":overrides={sorted(parsing_config.language_overrides.items())}"
+        )
+        extraction_cache = (
+            ExtractionCache(
+                get_data_dir() / "extraction_cache.db", version=extraction_cache_version
+            )
+            if parsing_config.enable_extraction_cache
+            else None
+        )
+        self.extractor = Extractor(self.parser_factory, cache=extraction_cache)
 
         # Memory manager
         self.memory_manager: MemoryManager = MemoryManager(config)
 
+        # Fixed for the strategy's lifetime; the semaphore is shared by all chunks
+        self._max_concurrency = self._get_concurrency()
+        self._extract_semaphore = asyncio.Semaphore(self._max_concurrency)
+
     # ═══════════════════════════════════════════════════════════
     # PUBLIC API: Chunked Processing
     # ═══════════════════════════════════════════════════════════
@@ -104,25 +142,44 @@ class AsyncIndexStrategy:
             f"(chunk_size={chunk_size}, reuse={reuse_embeddings})"
         )
 
-        async for chunk_index, chunk_files in iter_chunks(file_paths, chunk_size):
-            await self.embedding_provider.cleanup()
+        chunks = [chunk async for _, chunk in iter_chunks(file_paths, chunk_size)]
 
-            chunk_stats = await self._process_code_chunk(
-                chunk_files=chunk_files,
-                chunk_index=chunk_index,
-                show_progress=show_progress,
-                reuse_embeddings=reuse_embeddings,
-            )
+        # The next chunk is extracted while the current one is embedded and stored;
+        # at most one chunk is extracted ahead, keeping memory bounded to two chunks
+        next_extraction = asyncio.create_task(self._extract_files(chunks[0]))
+        try:
+            for chunk_index, chunk_files in enumerate(chunks):
+                await self.embedding_provider.cleanup()
 
-            stats.add_chunk(chunk_stats)
-            stats.total_chunks += 1
-            self.memory_manager.create_memory_barrier()
+                extracted = await next_extraction
+                if chunk_index + 1 < len(chunks):
+                    next_extraction = asyncio.create_task(
+                        self._extract_files(chunks[chunk_index + 1])
+                    )
 
-            logger.info(
-                f"Chunk {chunk_index + 1}: "
-                f"{chunk_stats.objects_count} objects "
-                f"(total: {stats.total_objects})"
-            )
+                chunk_stats = await self._process_code_chunk(
+                    chunk_files=chunk_files,
+                    chunk_index=chunk_index,
+                    show_progress=show_progress,
+                    reuse_embeddings=reuse_embeddings,
+                    extracted=extracted,
+                )
+                del extracted
+
+                stats.add_chunk(chunk_stats)
+                stats.total_chunks += 1
+                self.memory_manager.create_memory_barrier()
+
+                logger.info(
+                    f"Chunk {chunk_index + 1}: "
+                    f"{chunk_stats.objects_count} objects "
+                    f"(total: {stats.total_objects})"
+                )
+        finally:
+            # Wait for an abandoned extraction to stop rather than leave it running
+            next_extraction.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await next_extraction
 
         logger.info(f"Processing complete: {stats.total_objects} objects")
         return stats
@@ -176,6 +233,7 @@ class AsyncIndexStrategy:
         chunk_index: int,
         show_progress: bool,
         reuse_embeddings: bool,
+        extracted: tuple[list[CodeObject], list[Relationship], list[ImportInfo]] | None = None,
     ) -> ChunkStats:
         """Process single code chunk.
 
@@ -184,22 +242,35 @@ class AsyncIndexStrategy:
             chunk_index: Chunk index
             show_progress: Show progress
             reuse_embeddings: Reuse embeddings
+            extracted: Result of _extract_files for chunk_files (None = extract now)
 
         Returns:
             Chunk statistics
         """
 
         # Extract
-        chunk_objects, chunk_relationships = await self._extract_files(chunk_files)
+        if extracted is None:
+            extracted = await self._extract_files(chunk_files)
+        chunk_objects, chunk_relationships, chunk_imports = extracted
+
+        # Stored embeddings are looked up on a worker thread while relationships are linked
+        existing: asyncio.Future[list[CodeObject]] | None = None
+        if reuse_embeddings and chunk_objects:
+            existing = asyncio.get_running_loop().run_in_executor(
+                None,
+                self.storage.get_code_objects_batch,
+                [obj.deterministic_id for obj in chunk_objects],
+            )
 
-        # Embeddings
-        if reuse_embeddings:
-            chunk_objects, gen, reused = await self._embed_incremental(chunk_objects, show_progress)
-        else:
-            chunk_objects = await self._embed(chunk_objects, show_progress)
-            gen, reused = len(chunk_objects), 0
+        chunk_relationships = self._link_relationships(
+            chunk_objects, chunk_relationships, chunk_imports
+        )
 
-        await self._store_objects(chunk_objects, chunk_relationships, show_progress)
+        # Embeddings
+        reused = 0
+        if existing is not None:
+            reused = await self._reuse_embeddings(chunk_objects, existing)
+        gen = await self._embed_and_store(chunk_objects, chunk_relationships, show_progress)
 
         # Collect language statistics from actual indexed objects
         language_counts: dict[str, int] = {}
@@ -285,12 +356,13 @@ class AsyncIndexStrategy:
 
     async def _extract_files(
         self, file_paths: list[Path]
-    ) -> tuple[list[CodeObject], list[Relationship]]:
-        """Extract files sequentially with controlled concurrency."""
-        from codecontext.indexer.extractor import ExtractionResult
+    ) -> tuple[list[CodeObject], list[Relationship], list[ImportInfo]]:
+        """Extract files with controlled concurrency.
 
-        max_concurrent = self._get_concurrency()
-        semaphore = asyncio.Semaphore(max_concurrent)
+        Returns:
+            (objects, per-file relationships, import statements)
+        """
+        semaphore = self._extract_semaphore
 
         async def extract_one(file_path: Path) -> ExtractionResult | None:
             async with semaphore:
@@ -305,15 +377,34 @@ class AsyncIndexStrategy:
         all_imports = []
 
         tasks = [extract_one(fp) for fp in file_paths]
-        results = await asyncio.gather(*tasks)
-
-        for result in results:
-            if result:
-                all_objects.extend(result.objects)
-                all_relationships.extend(result.relationships)
-                all_imports.extend(result.imports)
+        with self.extractor.batch_cache_writes():
+            # Collect each file as it finishes so its result can be released right away
+            for completed in asyncio.as_completed(tasks):
+                result = await completed
+                if result:
+                    all_objects.extend(result.objects)
+                    all_relationships.extend(result.relationships)
+                    all_imports.extend(result.imports)
 
         logger.debug(f"Extracted {len(all_objects)} objects from {len(file_paths)} files")
+        return all_objects, all_relationships, all_imports
+
+    def _link_relationships(
+        self,
+        all_objects: list[CodeObject],
+        all_relationships: list[Relationship],
+        all_imports: list[ImportInfo],
+    ) -> list[Relationship]:
+        """Add cross-file and reverse relationships to a chunk's extraction results.
+
+        Args:
+            all_objects: Objects extracted from the chunk (parent ids are set in place)
+            all_relationships: Per-file relationships
+            all_imports: Import statements found in the chunk
+
+        Returns:
+            Unique relationships of the chunk with their reverses
+        """
         self._set_parent_ids(all_objects)
 
         # Resolve import relationships (cross-file)
@@ -325,19 +416,23 @@ class AsyncIndexStrategy:
             f"from {len(all_imports)} import statements"
         )
 
-        # Auto-generate reverse relationships
-        from codecontext_core.relationship_utils import create_reverse_relationship
+        # The same edge can resolve more than once (e.g. a module imported twice);
+        # keep one per key so each reverse relationship is generated once
+        relationships = list(
+            {(r.source_id, r.target_id, r.relation_type): r for r in all_relationships}.values()
+        )
 
-        reverse_relationships = []
-        for rel in all_relationships:
-            reverse_rel = create_reverse_relationship(rel)
-            if reverse_rel:
-                reverse_relationships.append(reverse_rel)
+        # Auto-generate reverse relationships
+        reverse_relationships = [
+            reverse
+            for rel in relationships
+            if (reverse := create_reverse_relationship(rel)) is not None
+        ]
 
-        all_relationships.extend(reverse_relationships)
+        relationships.extend(reverse_relationships)
         logger.debug(f"Generated {len(reverse_relationships)} reverse relationships")
 
-        return all_objects, all_relationships
+        return relationships
 
     def _set_parent_ids(self, objects: list[CodeObject]) -> None:
         """Set parent_deterministic_id.
@@ -347,42 +442,45 @@ class AsyncIndexStrategy:
         """
         id_map = {obj.id: obj.deterministic_id for obj in objects}
         for obj in objects:
-            if obj.parent_id and isinstance(obj.parent_id, UUID) and obj.parent_id in id_map:
-                obj.parent_deterministic_id = id_map[obj.parent_id]
+            if isinstance(obj.parent_id, UUID) and (
+                parent_deterministic_id := id_map.get(obj.parent_id)
+            ):
+                obj.parent_deterministic_id = parent_deterministic_id
 
     def _resolve_import_relationships(
-        self, imports: list["ImportInfo"], objects: list[CodeObject]
+        self, imports: list[ImportInfo], objects: list[CodeObject]
     ) -> list[Relationship]:
-        from codecontext_core.models import Relationship, RelationType
-
         if not imports or not objects:
             return []
 
-        name_map: dict[str, list[CodeObject]] = {}
-        file_map: dict[str, list[CodeObject]] = {}
-        path_index: dict[str, list[CodeObject]] = {}
+        name_map: defaultdict[str, list[CodeObject]] = defaultdict(list)
+        file_map: defaultdict[str, list[CodeObject]] = defaultdict(list)
+        path_index: defaultdict[str, list[CodeObject]] = defaultdict(list)
 
         for obj in objects:
-            if obj.name not in name_map:
-                name_map[obj.name] = []
             name_map[obj.name].append(obj)
-
-            if obj.relative_path not in file_map:
-                file_map[obj.relative_path] = []
             file_map[obj.relative_path].append(obj)
 
-            normalized_path = obj.relative_path.replace("/", ".").replace(".py", "")
-            if normalized_path not in path_index:
-                path_index[normalized_path] = []
-            path_index[normalized_path].append(obj)
+        # Module paths are derived once per file rather than once per object
+        for relative_path, file_objects in file_map.items():
+            module_path = relative_path.translate(_MODULE_PATH_TABLE).removesuffix(".py")
+            path_index[module_path].extend(file_objects)
 
+        # The same module is imported from many files; match each name once
+        matches: dict[str, list[CodeObject]] = {}
         relationships = []
         for import_info in imports:
-            matched = self._match_import_to_objects(import_info.imported_name, name_map, path_index)
-            source_objects = file_map.get(import_info.source_file, [])
+            source_objects = file_map.get(import_info.source_file)
             if not source_objects:
                 continue
 
+            imported_name = import_info.imported_name
+            matched = matches.get(imported_name)
+            if matched is None:
+                matched = matches[imported_name] = self._match_import_to_objects(
+                    imported_name, name_map, path_index
+                )
+
             source_obj = source_objects[0]
             for target_obj in matched:
                 relationships.append(
@@ -409,27 +507,15 @@ class AsyncIndexStrategy:
         name_map: dict[str, list[CodeObject]],
         path_index: dict[str, list[CodeObject]],
     ) -> list[CodeObject]:
-        matched = []
-
-        if imported_name in name_map:
-            matched.extend(name_map[imported_name])
+        matched = list(name_map.get(imported_name, ()))
 
         if "." in imported_name:
-            last_segment = imported_name.split(".")[-1]
-            if last_segment in name_map:
-                matched.extend(name_map[last_segment])
-
-            if imported_name in path_index:
-                matched.extend(path_index[imported_name])
+            matched.extend(name_map.get(imported_name.rpartition(".")[2], ()))
+            matched.extend(path_index.get(imported_name, ()))
 
-        seen = set()
-        unique = []
-        for obj in matched:
-            if obj.deterministic_id not in seen:
-                seen.add(obj.deterministic_id)
-                unique.append(obj)
-
-        return unique
+        if len(matched) <= 1:
+            return matched
+        return list({obj.deterministic_id: obj for obj in matched}.values())
 
     def _get_concurrency(self) -> int:
         """Get extraction concurrency.
@@ -437,14 +523,24 @@ class AsyncIndexStrategy:
         Returns:
             Concurrency level
         """
-        import os
-
         workers = self.config.indexing.parallel_workers
         if workers > 0:
             return workers
 
         cpu_count = os.cpu_count() or 4
-        return min(cpu_count // 2, 8)
+        return min(max(cpu_count // 2, 1), 8)
+
+    def _get_storage_concurrency(self) -> int:
+        """Get the number of storage writes kept in flight.
+
+        Embedded Qdrant does not support concurrent writers, so it gets one.
+
+        Returns:
+            Storage write concurrency
+        """
+        if self.config.storage.qdrant.mode == "embedded":
+            return 1
+        return self.config.indexing.storage_concurrency
 
     # ═══════════════════════════════════════════════════════════
     # EMBEDDINGS (Provider-agnostic)
@@ -457,70 +553,116 @@ class AsyncIndexStrategy:
         if not objects:
             return []
 
-        from codecontext.utils.streaming_progress import SimpleProgress
-
-        batch_size = self.embedding_provider.get_batch_size()
         progress = SimpleProgress(total=len(objects), desc="Embeddings") if show_progress else None
         instruction = self.config.embeddings.huggingface.instructions.nl2code_passage
 
+        texts = [instruction + obj.content for obj in objects]
+        for obj, embedding in zip(objects, await self._embed_texts(texts, progress), strict=True):
+            if embedding is not None:
+                obj.embedding = embedding
+
+        return objects
+
+    async def _embed_texts(
+        self, texts: list[str], progress: SimpleProgress | None
+    ) -> list[list[float] | None]:
+        """Embed texts in provider-sized batches, embedding each distinct text once.
+
+        Args:
+            texts: Instruction-prefixed texts
+            progress: Optional progress reporter (advanced by one per text)
+
+        Returns:
+            Embedding per text, in input order (None if the provider returned none)
+        """
+        cache = self._embedding_cache
+        embeddings: list[list[float] | None] = [None] * len(texts)
+
+        # Positions of each text still to embed; identical texts share one entry
+        pending: dict[bytes | int, list[int]] = {}
+        for i, text in enumerate(texts):
+            if cache is None:
+                pending[i] = [i]
+                continue
+            text_key = cache.key_for(text)
+            cached = cache.get(text_key)
+            if cached is not None:
+                embeddings[i] = cached
+            else:
+                pending.setdefault(text_key, []).append(i)
+
+        if progress and len(pending) < len(texts):
+            progress.update(len(texts) - len(pending))
+
+        entries = list(pending.items())
+        batch_size = self.embedding_provider.get_batch_size()
+
         async def batch_generator() -> AsyncGenerator[list[str], None]:
-            for i in range(0, len(objects), batch_size):
-                batch = objects[i : i + batch_size]
-                yield [instruction + obj.content for obj in batch]
+            for start in range(0, len(entries), batch_size):
+                yield [texts[positions[0]] for _, positions in entries[start : start + batch_size]]
 
-        batch_index = 0
-        async for embeddings in self.embedding_provider.embed_stream(
+        done = 0
+        async for batch_embeddings in self.embedding_provider.embed_stream(
             batch_generator(), progress=progress
         ):
-            start_idx = batch_index * batch_size
-            for i, embedding in enumerate(embeddings):
-                if start_idx + i < len(objects):
-                    objects[start_idx + i].embedding = embedding
-            batch_index += 1
-
-        return objects
+            # Each yielded batch answers the next batch sent; a short one would
+            # shift every later embedding onto the wrong text
+            batch_entries = entries[done : done + batch_size]
+            if len(batch_embeddings) != len(batch_entries):
+                msg = (
+                    f"Embedding provider returned {len(batch_embeddings)} embeddings "
+                    f"for a batch of {len(batch_entries)} texts"
+                )
+                raise EmbeddingError(msg)
+            for (key, positions), embedding in zip(batch_entries, batch_embeddings, strict=True):
+                for i in positions:
+                    embeddings[i] = embedding
+                if cache is not None and isinstance(key, bytes):
+                    cache.put(key, embedding)
+            done += len(batch_entries)
+
+        if cache is not None:
+            cache.commit()
+
+        return embeddings
+
+    def _embedding_model_id(self) -> str:
+        """Identify the model and settings that determine embedding values."""
+        embeddings_config = self.config.embeddings
+        if embeddings_config.provider == "openai":
+            return f"openai:{embeddings_config.openai.model}"
+
+        hf = embeddings_config.huggingface
+        return (
+            f"huggingface:{hf.model_name}:{hf.lora_adapter_path or ''}:{hf.quantization}:"
+            f"{hf.normalize_embeddings}:{hf.max_length}"
+        )
 
-    async def _embed_incremental(
-        self, objects: list[CodeObject], show_progress: bool = True
-    ) -> tuple[list[CodeObject], int, int]:
-        """Generate embeddings incrementally with reuse.
+    async def _reuse_embeddings(
+        self, objects: list[CodeObject], existing: Awaitable[list[CodeObject]]
+    ) -> int:
+        """Copy embeddings of already stored objects onto their re-extracted versions.
 
         Args:
             objects: Code objects
-            show_progress: Show progress
+            existing: Pending lookup of the stored objects
 
         Returns:
-            (objects, generated_count, reused_count)
+            Number of reused embeddings
         """
-        if not objects:
-            return [], 0, 0
-
-        # Fetch existing
-        ids = [obj.deterministic_id for obj in objects]
-        existing = self.storage.get_code_objects_batch(ids)
         existing_map = {
-            obj.deterministic_id: obj.embedding for obj in existing if obj.embedding is not None
+            obj.deterministic_id: obj.embedding
+            for obj in await existing
+            if obj.embedding is not None
         }
 
-        # Separate
-        to_generate = []
         reused = 0
-
         for obj in objects:
             if obj.deterministic_id in existing_map:
                 obj.embedding = existing_map[obj.deterministic_id]
                 reused += 1
-            else:
-                to_generate.append(obj)
-
-        # Generate new
-        generated = 0
-        if to_generate:
-            await self._embed(to_generate, show_progress)
-            generated = len(to_generate)
 
-        logger.debug(f"Embeddings: {generated} generated, {reused} reused")
-        return objects, generated, reused
+        return reused
 
     async def _embed_documents(
         self, documents: list[DocumentNode], show_progress: bool = True
@@ -529,32 +671,13 @@ class AsyncIndexStrategy:
         if not documents:
             return []
 
-        from codecontext.utils.streaming_progress import SimpleProgress
-
-        batch_size = self.embedding_provider.get_batch_size()
         progress = SimpleProgress(total=len(documents), desc="Documents") if show_progress else None
+        instruction = self.config.embeddings.huggingface.instructions.qa_passage
 
-        async def batch_generator() -> AsyncGenerator[list[str], None]:
-            for i in range(0, len(documents), batch_size):
-                batch = documents[i : i + batch_size]
-                texts = []
-                for doc in batch:
-                    instruction = self.config.embeddings.huggingface.instructions.qa_passage
-                    texts.append(instruction + doc.content)
-                yield texts
-
-        batch_index = 0
-        async for embeddings in self.embedding_provider.embed_stream(
-            batch_generator(), progress=progress
-        ):
-            start_idx = batch_index * batch_size
-            end_idx = min(start_idx + batch_size, len(documents))
-
-            for i, embedding in enumerate(embeddings):
-                if start_idx + i < end_idx:
-                    documents[start_idx + i].embedding = embedding
-
-            batch_index += 1
+        texts = [instruction + doc.content for doc in documents]
+        for doc, embedding in zip(documents, await self._embed_texts(texts, progress), strict=True):
+            if embedding is not None:
+                doc.embedding = embedding
 
         return documents
 
@@ -573,36 +696,57 @@ class AsyncIndexStrategy:
         if not documents or not self.translation_provider or not self.language_detector:
             return documents
 
-        from codecontext.utils.streaming_progress import SimpleProgress
-
-        translated_count = 0
+        translation_provider = self.translation_provider
+        language_detector = self.language_detector
+        semaphore = asyncio.Semaphore(self._max_concurrency)
         progress = (
             SimpleProgress(total=len(documents), desc="Translation") if show_progress else None
         )
 
-        for doc in documents:
-            if not doc.content or not doc.content.strip():
-                continue
+        async def detect(doc: DocumentNode) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(language_detector.detect, doc.content)
 
-            lang = self.language_detector.detect(doc.content)
+        pending = [doc for doc in documents if doc.content and doc.content.strip()]
+        languages = await asyncio.gather(*(detect(doc) for doc in pending))
 
+        # One batched translation stream per source language
+        groups: dict[str, list[DocumentNode]] = {}
+        for doc, lang in zip(pending, languages, strict=True):
             if lang != "en":
-                try:
-                    translated_content = self.translation_provider.translate_text(
-                        doc.content, source_lang=lang, target_lang="en"
-                    )
+                groups.setdefault(lang, []).append(doc)
 
-                    doc.metadata["original_text"] = doc.content
-                    doc.metadata["original_lang"] = lang
-                    doc.content = translated_content
-                    translated_count += 1
+        if progress:
+            progress.update(len(pending) - sum(len(group) for group in groups.values()))
 
-                    logger.debug(f"Translated document from {lang} to en: {doc.id}")
-                except Exception as e:
-                    logger.warning(f"Translation failed for document {doc.id}: {e}")
+        batch_size = translation_provider.get_batch_size()
+        translated_count = 0
+
+        for lang, group in groups.items():
 
-            if progress:
-                progress.update(1)
+            async def batch_generator(
+                group: list[DocumentNode] = group,
+            ) -> AsyncGenerator[list[str], None]:
+                for i in range(0, len(group), batch_size):
+                    yield [doc.content for doc in group[i : i + batch_size]]
+
+            done = 0
+            try:
+                async for translations in translation_provider.translate_stream(
+                    batch_generator(), source_lang=lang, target_lang="en", progress=progress
+                ):
+                    for doc, translated_content in zip(
+                        group[done : done + len(translations)], translations, strict=True
+                    ):
+                        doc.metadata["original_text"] = doc.content
+                        doc.metadata["original_lang"] = lang
+                        doc.content = translated_content
+                    done += len(translations)
+            except Exception as e:
+                logger.warning(f"Translation failed for {len(group) - done} {lang} documents: {e}")
+
+            translated_count += done
+            logger.debug(f"Translated {done} documents from {lang} to en")
 
         if progress:
             progress.close()
@@ -614,20 +758,87 @@ class AsyncIndexStrategy:
     # STORAGE
     # ═══════════════════════════════════════════════════════════
 
-    async def _store_objects(
+    async def _embed_and_store(
         self,
         objects: list[CodeObject],
         relationships: list[Relationship],
         show_progress: bool = True,
-    ) -> None:
+    ) -> int:
+        """Embed objects that have no embedding yet and store all of them.
+
+        Objects go through in batches holding one provider-sized batch of objects
+        to embed (and at most indexing.batch_size objects in all): each batch is
+        written on a worker thread while the next ones are embedded, with up to
+        _get_storage_concurrency() writes in flight. Each write gets only the
+        relationships of its own objects.
+
+        Args:
+            objects: Code objects
+            relationships: Relationships of the chunk
+            show_progress: Show progress
+
+        Returns:
+            Number of generated embeddings
+        """
         if not objects:
-            return
+            return 0
 
-        batch_size = self.config.indexing.batch_size
+        generated = sum(obj.embedding is None for obj in objects)
+        progress = (
+            SimpleProgress(total=generated, desc="Embeddings")
+            if show_progress and generated
+            else None
+        )
+        embed_batch_size = self.embedding_provider.get_batch_size()
+        store_batch_size = self.config.indexing.batch_size
+        loop = asyncio.get_running_loop()
+        writers = self._get_storage_concurrency()
+        storing: deque[asyncio.Future[None]] = deque()
+
+        relationships_by_object: defaultdict[str, list[Relationship]] = defaultdict(list)
+        for rel in relationships:
+            relationships_by_object[str(rel.source_id)].append(rel)
+            if rel.target_id != rel.source_id:
+                relationships_by_object[str(rel.target_id)].append(rel)
+
+        async def flush(batch: list[CodeObject], batch_to_embed: list[CodeObject]) -> None:
+            if batch_to_embed:
+                await self._embed(batch_to_embed, show_progress=False)
+                if progress:
+                    progress.update(len(batch_to_embed))
+
+            # A relationship between two objects of the batch is passed once
+            batch_relationships = list(
+                {
+                    id(rel): rel
+                    for obj in batch
+                    for rel in relationships_by_object.get(obj.deterministic_id, ())
+                }.values()
+            )
+            if len(storing) >= writers:
+                await storing.popleft()
+            storing.append(
+                loop.run_in_executor(
+                    None, self.storage.add_code_objects, batch, batch_relationships
+                )
+            )
+
+        obj_batch: list[CodeObject] = []
+        to_embed: list[CodeObject] = []
+        for obj in objects:
+            obj_batch.append(obj)
+            if obj.embedding is None:
+                to_embed.append(obj)
+            if len(to_embed) >= embed_batch_size or len(obj_batch) >= store_batch_size:
+                await flush(obj_batch, to_embed)
+                obj_batch, to_embed = [], []
+        if obj_batch:
+            await flush(obj_batch, to_embed)
 
-        for i in range(0, len(objects), batch_size):
-            obj_batch = objects[i : i + batch_size]
-            self.storage.add_code_objects(obj_batch, relationships)
+        await asyncio.gather(*storing)
+
+        logger.debug(f"Embeddings: {generated} generated, {len(objects) - generated} reused")
+        return generated
 
     async def _store_documents(
         self, documents: list[DocumentNode], show_progress: bool = True
@@ -642,7 +853,12 @@ class AsyncIndexStrategy:
             return
 
         batch_size = self.config.indexing.batch_size
+        semaphore = asyncio.Semaphore(self._get_storage_concurrency())
+
+        async def write(batch: list[DocumentNode]) -> None:
+            async with semaphore:
+                await asyncio.to_thread(self.storage.add_documents, batch)
 
-        for i in range(0, len(documents), batch_size):
-            batch = documents[i : i + batch_size]
-            self.storage.add_documents(batch)
+        await asyncio.gather(
+            *(write(documents[i : i + batch_size]) for i in range(0, len(documents), batch_size))
+        )
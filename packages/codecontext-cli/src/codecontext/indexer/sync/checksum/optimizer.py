@@ -9,6 +9,7 @@ Two-level optimization:
 """
 
 import logging
+import os
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import UTC, datetime
 from pathlib import Path
@@ -22,6 +23,13 @@ from codecontext.utils.checksum import calculate_file_checksum
 
 logger = logging.getLogger(__name__)
 
+# Threads for any batch of at least this many files (the previous fixed pool size)
+_MIN_WORKERS = 8
+
+# Files, or bytes, hashed per worker thread before another thread pays for itself
+_FILES_PER_WORKER = 64
+_BYTES_PER_WORKER = 8 * 1024 * 1024
+
 
 class ChecksumOptimizer:
     """Hierarchical checksum optimization for incremental indexing.
@@ -36,13 +44,15 @@ class ChecksumOptimizer:
     - Accurate deleted object detection
     """
 
-    def __init__(self, storage: VectorStore) -> None:
+    def __init__(self, storage: VectorStore, max_workers: int = 0) -> None:
         """Initialize checksum optimizer.
 
         Args:
             storage: Storage provider with checksum cache support
+            max_workers: Threads for batch checksums (0 = size from batch and CPU count)
         """
         self.storage = storage
+        self.max_workers = max_workers
 
     def should_skip_file(self, file_path: Path) -> bool:
         """Check if file can be skipped based on file-level checksum.
@@ -76,7 +86,7 @@ class ChecksumOptimizer:
             return False
 
     def should_skip_files_batch(
-        self, file_paths: list[Path], max_workers: int = 8
+        self, file_paths: list[Path], max_workers: int | None = None
     ) -> tuple[list[Path], list[Path]]:
         """Check multiple files in parallel for change detection.
 
@@ -85,7 +95,7 @@ class ChecksumOptimizer:
 
         Args:
             file_paths: List of file paths to check
-            max_workers: Maximum number of parallel workers (default: 8)
+            max_workers: Maximum number of parallel workers (default: see _get_workers)
 
         Returns:
             Tuple of (changed_files, unchanged_files):
@@ -106,8 +116,13 @@ class ChecksumOptimizer:
                 logger.warning(f"Failed to calculate checksum for {file_path}: {e}")
                 return file_path, None
 
-        # Parallelize checksum calculation using thread pool
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Parallelize checksum calculation using thread pool; the cached checksums
+        # (one batch query) are loaded on an extra thread while files are hashed
+        workers = max_workers or self._get_workers(len(file_paths), _total_size(file_paths))
+        with ThreadPoolExecutor(max_workers=workers + 1) as executor:
+            cached_future = executor.submit(
+                self.storage.get_file_checksums_batch, [str(fp) for fp in file_paths]
+            )
             futures = {executor.submit(_calculate_checksum, fp): fp for fp in file_paths}
 
             for future in as_completed(futures):
@@ -115,10 +130,7 @@ class ChecksumOptimizer:
                 if checksum is not None:
                     file_checksums[file_path] = checksum
 
-        # Step 2: Get cached checksums from storage (BATCH QUERY - 20-30% faster)
-        cached_checksums_dict = self.storage.get_file_checksums_batch(
-            [str(fp) for fp in file_checksums]
-        )
+            cached_checksums_dict = cached_future.result()
 
         # Convert back to Path keys
         cached_checksums: dict[Path, str] = {
@@ -154,6 +166,29 @@ class ChecksumOptimizer:
 
         return changed_files, unchanged_files
 
+    def _get_workers(self, file_count: int, total_bytes: int = 0) -> int:
+        """Get the thread count for hashing a batch of files.
+
+        xxHash releases the GIL and small files wait on I/O, so the pool may
+        exceed the core count. Batches get the previous default of 8 threads,
+        more when they hold many files or many bytes, and never more threads
+        than files.
+
+        Args:
+            file_count: Number of files in the batch
+            total_bytes: Combined size of the files
+
+        Returns:
+            Worker thread count
+        """
+        if self.max_workers > 0:
+            return self.max_workers
+
+        io_bound_limit = min(32, (os.cpu_count() or 1) + 4)
+        by_work = max(file_count // _FILES_PER_WORKER, total_bytes // _BYTES_PER_WORKER)
+        workers = max(_MIN_WORKERS, min(io_bound_limit, by_work))
+        return max(1, min(workers, file_count))
+
     def should_reuse_embedding(self, new_obj: CodeObject, old_obj: CodeObject | None) -> bool:
         """Check if object's embedding can be reused based on object-level checksum.
 
@@ -317,3 +352,14 @@ class ChecksumOptimizer:
             self._update_checksum_cache(file_path, file_checksum, objects)
         except (OSError, ValueError) as e:
             logger.warning(f"Failed to update checksums for {file_path}: {e}")
+
+
+def _total_size(file_paths: list[Path]) -> int:
+    """Sum file sizes, counting files that cannot be stat'ed as empty."""
+    total = 0
+    for file_path in file_paths:
+        try:
+            total += file_path.stat().st_size
+        except OSError:
+            continue
+    return total
@@ -1,8 +1,9 @@
 """File discovery and filtering for indexing."""
 
 import logging
+import os
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Literal
 
 import pathspec
 
@@ -11,13 +12,33 @@ if TYPE_CHECKING:
 
 from codecontext.indexer.ast_parser import LanguageDetector
 from codecontext.parsers.languages.config import ConfigFileParser
-from codecontext.utils.path_filter import PathFilter
+from codecontext.utils.path_filter import PathFilter, compile_spec
 
 logger = logging.getLogger(__name__)
 
+FileKind = Literal["code", "markdown", "config"]
+
+_MARKDOWN_EXTENSIONS = (".md", ".markdown")
+_DOCUMENT_EXTENSIONS = {".md", ".markdown", ".yaml", ".yml", ".json", ".properties"}
+
+
+def _extension_kinds() -> dict[str, FileKind]:
+    """Map each discoverable extension (case-sensitive) to the kind of file it marks."""
+    kinds: dict[str, FileKind] = {
+        ext: "code" for ext in LanguageDetector.EXTENSION_MAP if ext not in _DOCUMENT_EXTENSIONS
+    }
+    kinds.update(dict.fromkeys(ConfigFileParser.get_supported_extensions(), "config"))
+    kinds.update(dict.fromkeys(_MARKDOWN_EXTENSIONS, "markdown"))
+    return kinds
+
 
 class FileScanner:
-    """Discovers and filters files for indexing."""
+    """Discovers and filters files for indexing.
+
+    The repository is walked once with os.scandir; each file is bucketed by
+    extension, and directories matched by an exclude spec without negation
+    patterns are not descended into.
+    """
 
     def __init__(self, repository_path: Path, config: "Config") -> None:
         self.repository_path = repository_path
@@ -27,6 +48,18 @@ class FileScanner:
 
         self.include_spec = pathspec.PathSpec.from_lines("gitwildmatch", config.project.include)
         self.exclude_spec = pathspec.PathSpec.from_lines("gitwildmatch", config.project.exclude)
+        self._extension_kinds = _extension_kinds()
+
+        self._include_match = compile_spec(self.include_spec)
+        self._exclude_match = compile_spec(self.exclude_spec)
+        self._ignore_match = compile_spec(self.path_filter.spec)
+
+        # A negation pattern can re-include files below an excluded directory
+        self._prune_matches = [
+            compile_spec(spec)
+            for spec in (self.exclude_spec, self.path_filter.spec)
+            if not any(pattern.include is False for pattern in spec.patterns)
+        ]
 
         logger.info(
             f"FileScanner: {len(config.project.include)} include, "
@@ -34,7 +67,22 @@ class FileScanner:
         )
 
     def scan_source_files(self) -> list[Path]:
-        return self.scan_code_files() + self.scan_document_files()
+        code_files, document_files = self.scan_files()
+        return code_files + document_files
+
+    def scan_files(self) -> tuple[list[Path], list[Path]]:
+        """Discover code and document files in a single walk.
+
+        Returns:
+            (code_files, document_files)
+        """
+        files = self._walk()
+        logger.debug(f"Discovered {len(files['code'])} code files")
+        logger.info(
+            f"Document file discovery: {len(files['markdown'])} markdown, "
+            f"{len(files['config'])} config files"
+        )
+        return files["code"], files["markdown"] + files["config"]
 
     def scan_code_files(self) -> list[Path]:
         code_files = self._scan_code_files()
@@ -42,8 +90,9 @@ class FileScanner:
         return code_files
 
     def scan_document_files(self) -> list[Path]:
-        markdown_files = self._scan_markdown_files()
-        config_files = self._scan_config_files()
+        files = self._walk()
+        markdown_files = files["markdown"]
+        config_files = files["config"]
 
         logger.info(
             f"Document file discovery: {len(markdown_files)} markdown, "
@@ -53,38 +102,69 @@ class FileScanner:
         return markdown_files + config_files
 
     def _scan_code_files(self) -> list[Path]:
-        code_files = []
-
-        supported_extensions = set(LanguageDetector.EXTENSION_MAP.keys())
-        document_extensions = {".md", ".markdown", ".yaml", ".yml", ".json", ".properties"}
-        code_extensions = supported_extensions - document_extensions
-
-        for ext in code_extensions:
-            for file_path in self.repository_path.glob(f"**/*{ext}"):
-                if self._should_include_file(file_path, is_code=True):
-                    code_files.append(file_path)
-
-        return code_files
+        return self._walk()["code"]
 
     def _scan_markdown_files(self) -> list[Path]:
-        markdown_files = []
-
-        for pattern in ["**/*.md", "**/*.markdown"]:
-            for file_path in self.repository_path.glob(pattern):
-                if self._should_include_file(file_path, is_code=False):
-                    markdown_files.append(file_path)
-
-        return markdown_files
+        return self._walk()["markdown"]
 
     def _scan_config_files(self) -> list[Path]:
-        config_files = []
-
-        for ext in ConfigFileParser.get_supported_extensions():
-            for file_path in self.repository_path.glob(f"**/*{ext}"):
-                if self._should_include_file(file_path, is_code=False, is_config=True):
-                    config_files.append(file_path)
+        return self._walk()["config"]
+
+    def _walk(self) -> dict[FileKind, list[Path]]:
+        """Walk the repository once and bucket included files by kind.
+
+        Symlinked directories are not followed, matching recursive glob.
+
+        Returns:
+            Included files per kind
+        """
+        files: dict[FileKind, list[Path]] = {"code": [], "markdown": [], "config": []}
+        file_kind = self._file_kind
+        stack = [("", str(self.repository_path))]
+
+        while stack:
+            relative_dir, directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            for entry in entries:
+                relative_path = relative_dir + entry.name
+                if entry.is_dir(follow_symlinks=False):
+                    if not self._is_pruned(relative_path + "/"):
+                        stack.append((relative_path + "/", entry.path))
+                    continue
+
+                kind = file_kind(entry.name)
+                if kind is not None and self._should_include_entry(entry, relative_path):
+                    files[kind].append(Path(entry.path))
+
+        return files
+
+    def _file_kind(self, name: str) -> FileKind | None:
+        """Classify a file name by its (case-sensitive) extension."""
+        dot = name.rfind(".")
+        return self._extension_kinds.get(name[dot:]) if dot >= 0 else None
+
+    def _is_pruned(self, relative_dir: str) -> bool:
+        """Check whether every file below a directory ("dir/") is excluded."""
+        return any(match(relative_dir) for match in self._prune_matches)
+
+    def _should_include_entry(self, entry: os.DirEntry[str], relative_path: str) -> bool:
+        """Apply the file checks of _should_include_file to a scanned entry."""
+        try:
+            if not entry.is_file() or entry.stat().st_size > self.max_file_size_bytes:
+                return False
+        except OSError:
+            return False
 
-        return config_files
+        return (
+            self._include_match(relative_path)
+            and not self._exclude_match(relative_path)
+            and not self._ignore_match(relative_path)
+        )
 
     def _should_include_file(
         self, file_path: Path, is_code: bool = False, is_config: bool = False
@@ -99,10 +179,10 @@ class FileScanner:
 
         path_str = str(relative_path).replace("\\", "/")
 
-        if not self.include_spec.match_file(path_str):
+        if not self._include_match(path_str):
             return False
 
-        if self.exclude_spec.match_file(path_str):
+        if self._exclude_match(path_str):
             return False
 
         if file_path.stat().st_size > self.max_file_size_bytes:
@@ -111,20 +191,17 @@ class FileScanner:
         if not self.path_filter.should_index(file_path):
             return False
 
-        if is_code and not LanguageDetector.is_supported(file_path):
+        kind = self._file_kind(file_path.name)
+        if is_code and kind != "code":
             return False
 
-        if is_config:
-            config_parser = ConfigFileParser()
-            if not config_parser.is_supported(file_path):
-                return False
-
-        return True
+        return not (is_config and kind != "config")
 
     def get_file_statistics(self) -> dict[str, int]:
-        code_files = self._scan_code_files()
-        markdown_files = self._scan_markdown_files()
-        config_files = self._scan_config_files()
+        files = self._walk()
+        code_files = files["code"]
+        markdown_files = files["markdown"]
+        config_files = files["config"]
 
         return {
             "code_files": len(code_files),
@@ -33,8 +33,7 @@ class FullIndexStrategy(AsyncIndexStrategy):
 
         # Scan files
         scanner = FileScanner(repository_path, self.config)
-        code_files = scanner.scan_code_files()
-        document_files = scanner.scan_document_files()
+        code_files, document_files = scanner.scan_files()
 
         logger.info(
             f"Found {len(code_files)} code files, {len(document_files)} documents "
@@ -31,7 +31,7 @@ class IncrementalIndexStrategy(AsyncIndexStrategy):
             translation_provider: Optional translation provider
         """
         super().__init__(config, embedding_provider, storage, translation_provider)
-        self.checksum_optimizer = ChecksumOptimizer(storage)
+        self.checksum_optimizer = ChecksumOptimizer(storage, config.indexing.checksum_workers)
 
     async def index(self, repository_path: Path, show_progress: bool = True) -> IndexState:
         """Perform incremental indexing with chunked processing.
@@ -118,23 +118,11 @@ class IncrementalIndexStrategy(AsyncIndexStrategy):
         Returns:
             (changed_code_files, changed_document_files)
         """
-        from codecontext.utils.checksum import calculate_file_checksum
-
         scanner = FileScanner(repository_path, self.config)
-        all_code_files = scanner.scan_code_files()
-        all_doc_files = scanner.scan_document_files()
+        all_code_files, all_doc_files = scanner.scan_files()
 
-        # Detect changed code files using batch checksum comparison
+        # Detect changed files using batch checksum comparison
         changed_code, _ = self.checksum_optimizer.should_skip_files_batch(all_code_files)
-
-        # Detect changed document files
-        changed_docs = []
-        for doc_file in all_doc_files:
-            current_checksum = calculate_file_checksum(doc_file)
-            stored_checksum_obj = self.storage.get_file_checksum(str(doc_file))
-            stored_checksum = stored_checksum_obj.file_checksum if stored_checksum_obj else None
-
-            if current_checksum != stored_checksum:
-                changed_docs.append(doc_file)
+        changed_docs, _ = self.checksum_optimizer.should_skip_files_batch(all_doc_files)
 
         return changed_code, changed_docs
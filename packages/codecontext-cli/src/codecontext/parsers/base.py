@@ -14,6 +14,14 @@ from codecontext.parsers.common.chunkers.code_object_chunker import CodeObjectCh
 from codecontext.parsers.common.extractors import extract_name_and_build_object
 from codecontext.parsers.interfaces import CodeParser
 
+# Root node types of the supported grammars
+_ROOT_NODE_TYPES = frozenset({"module", "source_file", "program"})
+
+# Node types treated as methods inside a class body
+_METHOD_NODE_TYPES = frozenset(
+    {"function_definition", "function_declaration", "method_declaration"}
+)
+
 
 class BaseCodeParser(CodeParser):
     """
@@ -326,10 +334,11 @@ class BaseCodeParser(CodeParser):
         """
         parent = node.parent
         while parent:
-            if parent.type in class_types:
+            parent_type = parent.type
+            if parent_type in class_types:
                 return False
             # Check for module/source_file root
-            if parent.type in ["module", "source_file", "program"]:
+            if parent_type in _ROOT_NODE_TYPES:
                 return True
             parent = parent.parent
         return False
@@ -382,12 +391,7 @@ class BaseCodeParser(CodeParser):
         for body_field in ["body", "class_body"]:
             body_node = self.parser.find_child_by_field(class_node, body_field)
             if body_node:
-                return [
-                    child
-                    for child in body_node.children
-                    if child.type
-                    in ["function_definition", "function_declaration", "method_declaration"]
-                ]
+                return [child for child in body_node.children if child.type in _METHOD_NODE_TYPES]
         return []
 
     def _extract_enums_generic(
@@ -12,6 +12,7 @@ Architecture:
 
 from pathlib import Path
 
+import tree_sitter
 from codecontext_core.exceptions import UnsupportedLanguageError
 from codecontext_core.models import Language
 
@@ -67,9 +68,15 @@ class ParserFactory:
             enable_error_recovery=parsing_config.enable_error_recovery,
             partial_parse_threshold=parsing_config.partial_parse_threshold,
             language_overrides=parsing_config.language_overrides,
+            max_reference_nodes=parsing_config.max_reference_nodes,
         )
         return cls(parser_config)
 
+    @property
+    def parser_config(self) -> ParserConfig | None:
+        """Parser configuration shared by every parser this factory creates."""
+        return self._parser_config
+
     def get_parser(self, file_path: str) -> CodeParser:
         """Get CODE parser for file (CODE FILES ONLY).
 
@@ -102,6 +109,20 @@ class ParserFactory:
             self._cache[language] = self._create_parser(language)
         return self._cache[language]
 
+    def get_ts_language(self, language: Language) -> tree_sitter.Language:
+        """Get the tree-sitter grammar used for a language.
+
+        Args:
+            language: Language enum (CODE LANGUAGES ONLY)
+
+        Returns:
+            Tree-sitter language object of the cached parser
+
+        Raises:
+            UnsupportedLanguageError: If language is not supported
+        """
+        return self.get_parser_by_language(language).parser.ts_language
+
     def _create_parser(self, language: Language) -> CodeParser:
         """Create a new CODE parser instance for a language.
 
@@ -20,6 +20,12 @@ from codecontext.parsers.common.utilities.ast_common import (
     extract_references_generic,
 )
 
+# Ancestors that make a variable declaration nested rather than top-level
+_NESTING_NODE_TYPES = frozenset(
+    {"function_declaration", "arrow_function", "method_definition", "class_declaration"}
+)
+_TOP_LEVEL_NODE_TYPES = frozenset({"program", "export_statement"})
+
 
 class JSCommonParser(BaseCodeParser, NLGeneratorMixin):  # Mixin order is correct
     """Base parser with shared methods for JavaScript and TypeScript.
@@ -239,16 +245,12 @@ class JSCommonParser(BaseCodeParser, NLGeneratorMixin):  # Mixin order is correc
         """
         parent = node.parent
         while parent:
+            parent_type = parent.type
             # If we find these, the variable is nested (NOT top-level)
-            if parent.type in [
-                "function_declaration",
-                "arrow_function",
-                "method_definition",
-                "class_declaration",
-            ]:
+            if parent_type in _NESTING_NODE_TYPES:
                 return False
             # If we reach program or export_statement, it's top-level
-            if parent.type in ["program", "export_statement"]:
+            if parent_type in _TOP_LEVEL_NODE_TYPES:
                 return True
             parent = parent.parent
         return False
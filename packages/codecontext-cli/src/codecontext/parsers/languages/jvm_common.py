@@ -19,6 +19,9 @@ from codecontext.parsers.base import BaseCodeParser
 from codecontext.parsers.common.extractors import extract_name_and_build_object
 from codecontext.parsers.common.nl_generator import NLGeneratorMixin
 
+# Declarations whose name qualifies the methods nested in them
+_TYPE_DECLARATION_NODE_TYPES = frozenset({"class_declaration", "interface_declaration"})
+
 
 class JVMCommonParser(BaseCodeParser, NLGeneratorMixin):  # Mixin order is correct
     """Base parser with shared methods for Java and Kotlin.
@@ -267,7 +270,7 @@ class JVMCommonParser(BaseCodeParser, NLGeneratorMixin):  # Mixin order is corre
         qualified_name = name
         parent = node.parent
         while parent:
-            if parent.type in ["class_declaration", "interface_declaration"]:
+            if parent.type in _TYPE_DECLARATION_NODE_TYPES:
                 parent_name_node = self._get_name_node(parent)
                 if parent_name_node:
                     parent_name = self.parser.get_node_text(parent_name_node, source_bytes)
@@ -7,10 +7,13 @@ The pathspec library provides full gitignore semantics with acceptable overhead.
 """
 
 import logging
+import re
+from collections.abc import Callable
 from pathlib import Path
 from typing import ClassVar
 
 import pathspec
+from pathspec.pattern import RegexPattern
 
 logger = logging.getLogger(__name__)
 
@@ -208,6 +211,36 @@ class PathFilter:
         logger.debug(f"Added pattern: {pattern}")
 
 
+def compile_spec(spec: pathspec.PathSpec) -> Callable[[str], bool]:
+    """Build a matcher equivalent to spec.match_file for normalized relative paths.
+
+    Without negation patterns a path matches when any pattern matches, so all
+    patterns are joined into one regex and matched in a single call. Specs with
+    negation patterns depend on pattern order and keep using pathspec.
+
+    Args:
+        spec: Compiled gitwildmatch spec
+
+    Returns:
+        Function returning True if the path matches the spec
+    """
+    patterns = [
+        pattern
+        for pattern in spec.patterns
+        if isinstance(pattern, RegexPattern) and pattern.include is not None
+    ]
+    if any(pattern.include is False for pattern in patterns):
+        return spec.match_file
+    if not patterns:
+        return lambda path: False
+
+    # Each pattern names its directory group ps_d; names must be unique in one regex
+    regex = re.compile(
+        "|".join(f"(?:{pattern.regex.pattern.replace('(?P<ps_d>', '(?:')})" for pattern in patterns)
+    )
+    return lambda path: regex.match(path) is not None
+
+
 def create_path_filter(repository_path: Path) -> PathFilter:
     """Convenience function to create a path filter.
 
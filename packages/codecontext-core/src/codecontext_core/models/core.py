@@ -358,7 +358,7 @@ class DocumentNode:
         return doc
 
 
-@dataclass
+@dataclass(slots=True)
 class Relationship:
     source_id: str
     source_name: str
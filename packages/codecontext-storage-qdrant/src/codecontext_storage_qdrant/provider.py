@@ -77,6 +77,7 @@ class QdrantProvider(VectorStore):
         self.enable_performance_logging = getattr(config, "enable_performance_logging", False)
         self.vector_size: int | None = None
         self.upsert_batch_size = getattr(config, "upsert_batch_size", 100)
+        self.vector_dtype = getattr(config, "vector_dtype", "float32")
 
         # BM25F encoder
         weights = {
@@ -139,16 +140,40 @@ class QdrantProvider(VectorStore):
 
         Sparse vectors use IDF modifier for complete BM25 implementation.
         Qdrant 1.10+ computes IDF automatically in real-time.
+
+        Dense vectors are stored as float16 when vector_dtype is "float16". With
+        "int8", Qdrant keeps the float32 vectors and searches an int8 scalar-quantized
+        copy held in RAM, rescoring candidates with the originals.
         """
         if not self.client or not self.vector_size:
             raise StorageError("Client not initialized or vector size not set")
 
-        from qdrant_client.models import Modifier
+        from qdrant_client.models import (
+            Datatype,
+            Modifier,
+            ScalarQuantization,
+            ScalarQuantizationConfig,
+            ScalarType,
+        )
+
+        dense = VectorParams(
+            size=self.vector_size,
+            distance=Distance.COSINE,
+            datatype=Datatype.FLOAT16 if self.vector_dtype == "float16" else None,
+        )
+        quantization = (
+            ScalarQuantization(
+                scalar=ScalarQuantizationConfig(type=ScalarType.INT8, always_ram=True)
+            )
+            if self.vector_dtype == "int8"
+            else None
+        )
 
         self.client.create_collection(
             collection_name=self.collection_name,
-            vectors_config={"dense": VectorParams(size=self.vector_size, distance=Distance.COSINE)},
+            vectors_config={"dense": dense},
             sparse_vectors_config={"sparse": SparseVectorParams(modifier=Modifier.IDF)},
+            quantization_config=quantization,
         )
         logger.info(f"Created collection with IDF modifier: {self.collection_name}")
 
@@ -3,6 +3,7 @@
 import asyncio
 import gc
 import logging
+import threading
 from typing import AsyncGenerator, Protocol
 
 import torch
@@ -42,6 +43,8 @@ class NLLBProvider(TranslationProvider):
         self.device_strategy: DeviceStrategy | None = None
         self._batch_counter = 0
         self._initialized = False
+        # src_lang is tokenizer state, so concurrent batches must not interleave it
+        self._tokenizer_lock = threading.Lock()
 
     async def initialize(self) -> None:
         if self._initialized:
@@ -105,17 +108,18 @@ class NLLBProvider(TranslationProvider):
         src_code = self._get_lang_code(source_lang)
         tgt_code = self._get_lang_code(target_lang)
 
-        # Set source language
-        self.tokenizer.src_lang = src_code
-
-        # Tokenize
-        inputs = self.tokenizer(
-            texts,
-            padding=True,
-            truncation=True,
-            max_length=self.config.max_length,
-            return_tensors="pt",
-        )
+        with self._tokenizer_lock:
+            # Set source language
+            self.tokenizer.src_lang = src_code
+
+            # Tokenize
+            inputs = self.tokenizer(
+                texts,
+                padding=True,
+                truncation=True,
+                max_length=self.config.max_length,
+                return_tensors="pt",
+            )
 
         device = self.device_strategy.get_device_name()
         inputs = {k: v.to(device) for k, v in inputs.items()}
@@ -8,6 +8,7 @@ import asyncio
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
+from codecontext.config.schema import ParsingConfig
 from codecontext.indexer.sync import FullIndexStrategy
 from codecontext_core.models import IndexStatus
 
@@ -23,12 +24,16 @@ def mock_config():
     config.indexing.max_file_size_mb = 10
     config.indexing.batch_size = 100
     config.indexing.parallel_workers = 4
+    config.indexing.storage_concurrency = 4
+    config.indexing.checksum_workers = 0
     config.indexing.parallel_enabled = False
     config.indexing.languages = ["python", "java", "javascript", "typescript", "kotlin"]
     config.indexing.streaming = Mock()
     config.indexing.streaming.chunk_size = 100
+    config.indexing.parsing = ParsingConfig()
     config.embeddings = Mock()
     config.embeddings.provider = "huggingface"
+    config.embeddings.persistent_cache = False
     config.embeddings.huggingface = Mock()
     config.embeddings.huggingface.model_name = "sentence-transformers/all-MiniLM-L6-v2"
     config.embeddings.huggingface.device = "cpu"
@@ -44,6 +49,7 @@ def mock_embedding_provider():
     """Create mock embedding provider with proper async support."""
     provider = AsyncMock()
     provider.get_dimension = Mock(return_value=768)
+    provider.get_batch_size = Mock(return_value=64)
 
     # Track embed_stream calls
     provider.embed_stream_call_count = 0
@@ -7,6 +7,7 @@ Tests cover:
 4. Integration with process_file_with_checksum
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -687,3 +688,86 @@ class TestBatchChecksumCalculation:
             assert mock_calc.call_count == 20  # All files processed
             # Verify batch query was called once with all file paths
             mock_storage.get_file_checksums_batch.assert_called_once()
+
+    def test_batch_loads_cached_checksums_while_hashing(
+        self, checksum_optimizer, mock_storage, tmp_path
+    ):
+        """Should query cached checksums for every file before hashing finishes."""
+        import threading
+
+        files = [tmp_path / f"file{i}.py" for i in range(3)]
+        lookup_started = threading.Event()
+
+        def get_file_checksums_batch(paths):
+            lookup_started.set()
+            return {str(files[0]): "checksum"}
+
+        def calculate_file_checksum(file_path):
+            assert lookup_started.wait(timeout=5)
+            return "checksum"
+
+        mock_storage.get_file_checksums_batch.side_effect = get_file_checksums_batch
+        with patch(
+            "codecontext.indexer.sync.checksum.optimizer.calculate_file_checksum",
+            side_effect=calculate_file_checksum,
+        ):
+            changed, unchanged = checksum_optimizer.should_skip_files_batch(files)
+
+        assert unchanged == [files[0]]
+        assert changed == files[1:]
+        mock_storage.get_file_checksums_batch.assert_called_once_with([str(f) for f in files])
+
+
+class TestChecksumWorkers:
+    """Tests for sizing the batch checksum thread pool."""
+
+    @pytest.mark.parametrize(
+        ("file_count", "total_bytes", "cpu_count", "expected"),
+        [
+            (1, 0, 8, 1),  # Never more threads than files
+            (100, 0, 8, 8),  # Small batch: the default pool
+            (100, 0, 2, 8),  # The default pool even on few cores
+            (640, 0, 8, 10),  # One thread per 64 files
+            (100_000, 0, 8, 12),  # Capped at cpu_count + 4
+            (100_000, 0, 64, 32),  # Never more than 32
+            (40, 40 * 16 * 1024 * 1024, 64, 32),  # Few large files: one thread per 8 MiB
+        ],
+    )
+    def test_auto_workers(self, mock_storage, file_count, total_bytes, cpu_count, expected):
+        """Should scale threads with the batch up to the I/O-bound limit."""
+        optimizer = ChecksumOptimizer(mock_storage)
+
+        with patch("os.cpu_count", return_value=cpu_count):
+            assert optimizer._get_workers(file_count, total_bytes) == expected
+
+    def test_batch_sizes_pool_from_file_sizes(self, mock_storage, tmp_path):
+        """Should give a small batch of large files more than the default pool."""
+        files = []
+        for i in range(20):
+            file_path = tmp_path / f"blob{i}.bin"
+            with file_path.open("wb") as f:
+                f.truncate(16 * 1024 * 1024)
+            files.append(file_path)
+        optimizer = ChecksumOptimizer(mock_storage)
+
+        with (
+            patch("os.cpu_count", return_value=64),
+            patch(
+                "codecontext.indexer.sync.checksum.optimizer.calculate_file_checksum",
+                return_value="checksum",
+            ),
+            patch(
+                "codecontext.indexer.sync.checksum.optimizer.ThreadPoolExecutor",
+                wraps=ThreadPoolExecutor,
+            ) as executor,
+        ):
+            optimizer.should_skip_files_batch(files)
+
+        # One thread per file plus the cached checksum lookup
+        assert executor.call_args.kwargs["max_workers"] == 21
+
+    def test_configured_workers(self, mock_storage):
+        """Should use the configured thread count when set."""
+        optimizer = ChecksumOptimizer(mock_storage, max_workers=3)
+
+        assert optimizer._get_workers(10) == 3
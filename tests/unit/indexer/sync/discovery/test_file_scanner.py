@@ -10,7 +10,8 @@ Tests cover:
 7. Statistics generation
 """
 
-from unittest.mock import Mock
+import os
+from unittest.mock import Mock, patch
 
 import pytest
 from codecontext.indexer.sync.discovery.file_scanner import FileScanner
@@ -294,6 +295,21 @@ class TestFileScanner:
         # Just verify the method doesn't crash
         scanner._should_include_file(small_file, is_code=True)
 
+    def test_should_include_file_matches_scan_case(self, tmp_path, mock_config):
+        """Should classify extensions with the same case sensitivity as the scan."""
+        (tmp_path / "main.py").write_text("x = 1")
+        (tmp_path / "LEGACY.PY").write_text("x = 1")
+        scanner = FileScanner(tmp_path, mock_config)
+
+        scanned = {path.name for path in scanner.scan_code_files()}
+        included = {
+            name
+            for name in ("main.py", "LEGACY.PY")
+            if scanner._should_include_file(tmp_path / name, is_code=True)
+        }
+
+        assert included == scanned
+
     def test_markdown_discovery(self, test_repository, mock_config):
         """Should discover both .md and .markdown files."""
         scanner = FileScanner(test_repository, mock_config)
@@ -384,6 +400,44 @@ class TestFileScanner:
         assert ".jsx" in extensions
         assert ".tsx" in extensions
 
+    def test_scan_files_splits_code_and_documents(self, test_repository, mock_config):
+        """Should return the same files as the separate code and document scans."""
+        scanner = FileScanner(test_repository, mock_config)
+
+        code_files, document_files = scanner.scan_files()
+
+        assert sorted(code_files) == sorted(scanner.scan_code_files())
+        assert sorted(document_files) == sorted(scanner.scan_document_files())
+
+    def test_excluded_directory_not_descended(self, tmp_path, mock_config):
+        """Should not list directories whose contents are all excluded."""
+        repo = tmp_path / "pruned"
+        (repo / "generated" / "gen").mkdir(parents=True)
+        (repo / "generated" / "gen" / "out.py").write_text("# Generated\n")
+        (repo / "main.py").write_text("# Main\n")
+        mock_config.project.exclude = ["generated/"]
+
+        scanner = FileScanner(repo, mock_config)
+        with patch(
+            "codecontext.indexer.sync.discovery.file_scanner.os.scandir", wraps=os.scandir
+        ) as scandir:
+            code_files = scanner.scan_code_files()
+
+        assert [f.name for f in code_files] == ["main.py"]
+        assert [call.args[0] for call in scandir.call_args_list] == [str(repo)]
+
+    def test_negated_exclude_still_descends(self, tmp_path, mock_config):
+        """Should find files re-included by a negation pattern below an excluded directory."""
+        repo = tmp_path / "negated"
+        (repo / "generated").mkdir(parents=True)
+        (repo / "generated" / "keep.py").write_text("# Keep\n")
+        (repo / "generated" / "drop.py").write_text("# Drop\n")
+        mock_config.project.exclude = ["generated/", "!generated/keep.py"]
+
+        scanner = FileScanner(repo, mock_config)
+
+        assert [f.name for f in scanner.scan_code_files()] == ["keep.py"]
+
 
 class TestFileScannerEdgeCases:
     """Test edge cases and error handling."""
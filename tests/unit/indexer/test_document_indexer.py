@@ -0,0 +1,132 @@
+"""Tests for markdown section splitting and code reference extraction.
+
+Tests the DocumentIndexer class from indexer.document_indexer module.
+"""
+
+import dataclasses
+
+import pytest
+from codecontext.indexer.document_indexer import DocumentIndexer
+
+
+@pytest.fixture
+def indexer():
+    """Create a DocumentIndexer instance."""
+    return DocumentIndexer()
+
+
+class TestSplitByHeaders:
+    """Test splitting markdown content into header sections."""
+
+    def test_splits_on_level_two_and_deeper_headers(self, indexer):
+        """Should create one section per ##-###### header."""
+        content = "# Title\nintro\n## Setup\nstep 1\n### Details\nmore\n## Usage\nrun it"
+
+        sections = indexer.split_by_headers(content, "doc.md")
+
+        assert [s.title for s in sections] == ["Setup", "Details", "Usage"]
+        assert [s.depth for s in sections] == [2, 3, 2]
+
+    def test_section_content_and_line_numbers(self, indexer):
+        """Should keep header line in content and report 1-indexed line ranges."""
+        content = "intro\n## First\na\nb\n## Second\nc\n"
+
+        first, second = indexer.split_by_headers(content, "doc.md")
+
+        assert first.content == "## First\na\nb"
+        assert (first.start_line, first.end_line) == (2, 4)
+        assert second.content == "## Second\nc\n"
+        assert (second.start_line, second.end_line) == (5, 7)
+
+    def test_ignores_non_header_hash_lines(self, indexer):
+        """Should not treat h1, h7+, or markers without a title as headers."""
+        content = "# h1\n####### seven\n##nospace\n## \n #### indented"
+
+        assert indexer.split_by_headers(content, "doc.md") == []
+
+    def test_headers_only_match_at_line_start(self, indexer):
+        """Should ignore ## markers that do not begin a line."""
+        content = "text ## inline\n## Real\nsee ## also inline\n\n## Next\n"
+
+        sections = indexer.split_by_headers(content, "doc.md")
+
+        assert [(s.title, s.start_line, s.end_line) for s in sections] == [
+            ("Real", 2, 4),
+            ("Next", 5, 6),
+        ]
+
+    def test_strips_title_whitespace(self, indexer):
+        """Should strip surrounding whitespace from header titles."""
+        sections = indexer.split_by_headers("##\t  Spaced Title  \r\nbody", "doc.md")
+
+        assert sections[0].title == "Spaced Title"
+        assert sections[0].depth == 2
+
+    def test_empty_content(self, indexer):
+        """Should return no sections for empty content."""
+        assert indexer.split_by_headers("", "doc.md") == []
+
+    def test_sections_are_immutable(self, indexer):
+        """Should return frozen, slotted sections."""
+        section = indexer.split_by_headers("## Title\nbody", "doc.md")[0]
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            section.title = "changed"
+        assert not hasattr(section, "__dict__")
+
+
+class TestExtractCodeReferences:
+    """Test extracting code and file references from markdown."""
+
+    def test_extracts_backtick_and_file_references(self, indexer):
+        """Should return backtick references followed by file references."""
+        content = "Use `MongoClient` from python/infra/mongodb.py and `Driver.connect`."
+
+        references = indexer.extract_code_references(content)
+
+        assert references == [
+            {"name": "MongoClient", "type": "code_ref", "match_reason": "backtick reference"},
+            {"name": "Driver.connect", "type": "code_ref", "match_reason": "backtick reference"},
+            {
+                "name": "python/infra/mongodb.py",
+                "type": "file_ref",
+                "match_reason": "file reference",
+            },
+        ]
+
+    def test_file_inside_backticks_is_reported_twice(self, indexer):
+        """Should report a backticked file name as both a code and a file reference."""
+        references = indexer.extract_code_references("See `Driver.kt` for details")
+
+        assert [(r["name"], r["type"]) for r in references] == [
+            ("Driver.kt", "code_ref"),
+            ("Driver.kt", "file_ref"),
+        ]
+
+    def test_ignores_lowercase_backticks(self, indexer):
+        """Should only treat capitalized backtick spans as code references."""
+        assert indexer.extract_code_references("run `make build` now") == []
+
+    def test_skips_overlong_path_runs(self, indexer):
+        """Should not report path-like runs longer than 128 characters."""
+        long_path = "a/" * 100 + "module.py"
+
+        references = indexer.extract_code_references(f"see {long_path} or ok/file.py")
+
+        assert [r["name"] for r in references] == ["ok/file.py"]
+
+    def test_long_runs_without_extension(self, indexer):
+        """Should handle long identifier runs without a file extension."""
+        assert indexer.extract_code_references("x" * 100_000 + ". done") == []
+
+    def test_repeated_content_returns_independent_results(self, indexer):
+        """Should not leak caller mutations into results for identical content."""
+        content = "Call `Retriever.search` in search/retriever.py"
+
+        first = indexer.extract_code_references(content)
+        first[0]["name"] = "mutated"
+        first.clear()
+
+        second = indexer.extract_code_references(content)
+
+        assert [r["name"] for r in second] == ["Retriever.search", "search/retriever.py"]
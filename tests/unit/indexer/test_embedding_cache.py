@@ -0,0 +1,86 @@
+"""Tests for the in-memory embedding cache.
+
+Tests the EmbeddingCache class from indexer.embedding_cache module.
+"""
+
+import sys
+
+from codecontext.indexer.embedding_cache import EmbeddingCache
+
+
+class TestEmbeddingCache:
+    """Test keys, lookups and eviction."""
+
+    def test_key_depends_on_exact_text(self):
+        """Should give identical texts the same key and different texts distinct keys."""
+        key = EmbeddingCache.key_for("passage: def area(self): pass")
+
+        assert key == EmbeddingCache.key_for("passage: def area(self): pass")
+        assert key != EmbeddingCache.key_for("query: def area(self): pass")
+
+    def test_evicts_least_recently_used(self):
+        """Should drop the entry that was used longest ago when full."""
+        cache = EmbeddingCache(maxsize=2)
+        cache.put(b"a", [1.0])
+        cache.put(b"b", [2.0])
+
+        assert cache.get(b"a") == [1.0]
+        cache.put(b"c", [3.0])
+
+        assert cache.get(b"b") is None
+        assert cache.get(b"a") == [1.0]
+        assert cache.get(b"c") == [3.0]
+        assert len(cache) == 2
+
+    def test_zero_size_stores_nothing(self):
+        """Should not keep entries when maxsize is 0."""
+        cache = EmbeddingCache(maxsize=0)
+        cache.put(b"a", [1.0])
+
+        assert cache.get(b"a") is None
+        assert len(cache) == 0
+
+    def test_stores_float32_in_memory(self):
+        """Should hold about 4 bytes per dimension per entry rather than boxed floats."""
+        cache = EmbeddingCache(maxsize=1)
+        embedding = [i / 1024 for i in range(1024)]
+        cache.put(b"a", embedding)
+
+        assert sys.getsizeof(cache._entries[b"a"]) < 1024 * 4 + 128
+        assert cache.get(b"a") == embedding
+
+
+class TestPersistentEmbeddingCache:
+    """Test embeddings kept in SQLite across cache instances."""
+
+    def test_reloads_committed_embeddings(self, tmp_path):
+        """Should serve embeddings stored by an earlier instance for the same model."""
+        path = tmp_path / "embeddings.db"
+        cache = EmbeddingCache(maxsize=10, path=path, model_id="model-a")
+        cache.put(b"a", [0.5, -1.0])
+        cache.close()
+
+        reopened = EmbeddingCache(maxsize=10, path=path, model_id="model-a")
+
+        assert reopened.get(b"a") == [0.5, -1.0]
+        assert len(reopened) == 1
+
+    def test_separates_models(self, tmp_path):
+        """Should not serve embeddings produced by a different model."""
+        path = tmp_path / "embeddings.db"
+        cache = EmbeddingCache(maxsize=10, path=path, model_id="model-a")
+        cache.put(b"a", [0.5])
+        cache.commit()
+
+        other = EmbeddingCache(maxsize=10, path=path, model_id="model-b")
+
+        assert other.get(b"a") is None
+
+    def test_zero_memory_size_still_persists(self, tmp_path):
+        """Should write to the database when no entries are kept in memory."""
+        cache = EmbeddingCache(maxsize=0, path=tmp_path / "embeddings.db", model_id="m")
+        cache.put(b"a", [0.25])
+        cache.commit()
+
+        assert len(cache) == 0
+        assert cache.get(b"a") == [0.25]
@@ -0,0 +1,52 @@
+"""Tests for type-based content expansions.
+
+Tests expand_content from indexer.expansions module.
+"""
+
+import pytest
+from codecontext.indexer.expansions import expand_content
+from codecontext_core.models import ObjectType
+
+from tests.fixtures.factories import create_code_object
+
+
+def make_object(object_type: ObjectType, content: str = "def run(): pass"):
+    """Create a code object of the given type."""
+    return create_code_object(
+        name="run",
+        file_path="/repo/src/app.py",
+        relative_path="src/app.py",
+        object_type=object_type,
+        content=content,
+    )
+
+
+class TestExpandContent:
+    """Test keyword expansion of code object content."""
+
+    @pytest.mark.parametrize(
+        ("object_type", "suffix"),
+        [
+            (ObjectType.ENUM, " definition constant values enumeration"),
+            (ObjectType.INTERFACE, " contract protocol specification"),
+            (ObjectType.CLASS, " type implementation"),
+            (ObjectType.FUNCTION, " procedure routine"),
+            (ObjectType.METHOD, " procedure routine"),
+        ],
+    )
+    def test_appends_type_keywords(self, object_type, suffix):
+        """Should append the keywords registered for the object type."""
+        obj = make_object(object_type)
+
+        assert expand_content(obj) == "def run(): pass" + suffix
+
+    def test_leaves_other_types_unchanged(self):
+        """Should return content as-is for types without keywords."""
+        obj = make_object(ObjectType.VARIABLE, content="MAX = 1")
+
+        assert expand_content(obj) == "MAX = 1"
+
+    def test_every_object_type_expands(self):
+        """Should expand objects of every ObjectType without a lookup error."""
+        for object_type in ObjectType:
+            assert expand_content(make_object(object_type)).startswith("def run(): pass")
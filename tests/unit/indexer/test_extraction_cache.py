@@ -0,0 +1,108 @@
+"""Tests for the persistent extraction result cache.
+
+Tests the ExtractionCache class and its use by Extractor.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from codecontext.indexer.extraction_cache import ExtractionCache
+from codecontext.indexer.extractor import ExtractionResult, Extractor
+from codecontext.parsers.factory import ParserFactory
+
+
+@pytest.fixture
+def cache(tmp_path):
+    """Create an ExtractionCache in a temporary directory."""
+    cache = ExtractionCache(tmp_path / "cache" / "extraction.db")
+    yield cache
+    cache.close()
+
+
+class TestExtractionCache:
+    """Test cache keys and storage."""
+
+    def test_key_depends_on_path_content_and_version(self, cache, tmp_path):
+        """Should produce distinct keys when any key component changes."""
+        other_version = ExtractionCache(tmp_path / "other.db", version="other")
+
+        key = cache.key_for("a.py", "x = 1")
+
+        assert key == cache.key_for("a.py", "x = 1")
+        assert key != cache.key_for("b.py", "x = 1")
+        assert key != cache.key_for("a.py", "x = 2")
+        assert key != other_version.key_for("a.py", "x = 1")
+        other_version.close()
+
+    def test_missing_key_returns_none(self, cache):
+        """Should report a miss for unknown keys."""
+        assert cache.get("missing") is None
+
+    def test_key_depends_on_parser_versions(self, cache, tmp_path):
+        """Should not reuse keys after tree-sitter or a grammar package changes."""
+        with patch("codecontext.indexer.extraction_cache._PARSER_VERSIONS", "tree-sitter=0.0"):
+            upgraded = ExtractionCache(tmp_path / "upgraded.db")
+
+        assert upgraded.key_for("a.py", "x = 1") != cache.key_for("a.py", "x = 1")
+        upgraded.close()
+
+    def test_batch_commits_once_on_exit(self, cache):
+        """Should hold writes made inside a batch until the block ends."""
+        reader = ExtractionCache(cache.path)
+        result = ExtractionResult(objects=[], relationships=[])
+
+        with cache.batch():
+            cache.put("key", result)
+            assert reader.get("key") is None
+
+        assert reader.get("key") == result
+        reader.close()
+
+
+class TestExtractorWithCache:
+    """Test that Extractor serves unchanged content from the cache."""
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_skips_extraction(self, cache, tmp_path):
+        """Should return the cached result without re-parsing an unchanged file."""
+        file_path = tmp_path / "shapes.py"
+        file_path.write_text("class Shape:\n    def area(self):\n        pass\n")
+        extractor = Extractor(ParserFactory(), cache=cache)
+
+        first = await extractor.extract_from_file(str(file_path))
+        with patch.object(extractor, "_extract_uncached") as extract:
+            second = await extractor.extract_from_file(str(file_path))
+
+        extract.assert_not_called()
+        assert [o.deterministic_id for o in second.objects] == [
+            o.deterministic_id for o in first.objects
+        ]
+        assert len(second.relationships) == len(first.relationships)
+
+    @pytest.mark.asyncio
+    async def test_modified_file_is_extracted_again(self, cache, tmp_path):
+        """Should re-extract a file whose content changed."""
+        file_path = tmp_path / "shapes.py"
+        file_path.write_text("class Shape:\n    pass\n")
+        extractor = Extractor(ParserFactory(), cache=cache)
+
+        await extractor.extract_from_file(str(file_path))
+        file_path.write_text("class Circle:\n    pass\n\nclass Square:\n    pass\n")
+        result = await extractor.extract_from_file(str(file_path))
+
+        assert [o.name for o in result.objects] == ["Circle", "Square"]
+
+    @pytest.mark.asyncio
+    async def test_supplied_content_uses_content_key(self, cache):
+        """Should cache results for in-memory content by its hash."""
+        extractor = Extractor(ParserFactory(), cache=cache)
+        code = "def greet():\n    pass\n"
+
+        first = await extractor.extract_from_file("greet.py", content=code)
+
+        assert cache.get(cache.key_for("greet.py", code)) is not None
+        with patch.object(extractor, "_extract_uncached") as extract:
+            second = await extractor.extract_from_file("greet.py", content=code)
+
+        extract.assert_not_called()
+        assert [o.name for o in second.objects] == [o.name for o in first.objects]
@@ -4,11 +4,45 @@ Tests the Extractor class which performs AST parsing once and extracts
 both code objects and relationships in a single pass.
 """
 
+import re
+from collections import deque
+from types import SimpleNamespace
+from unittest.mock import patch
+
 import pytest
-from codecontext.indexer.extractor import ExtractionResult, Extractor
+from codecontext.indexer.ast_parser import ParserConfig
+from codecontext.indexer.extractor import (
+    _RELATIONSHIP_PATTERNS,
+    ExtractionResult,
+    Extractor,
+    _compile_combined_query,
+    _compile_query,
+    _cursor_pool,
+    _TargetIndex,
+)
 from codecontext.parsers.factory import ParserFactory as PF
 from codecontext_core.models import ObjectType, RelationType
 
+from tests.fixtures.factories import create_code_object
+
+
+def clear_query_caches():
+    """Empty the module-level query caches so compilation can be observed."""
+    _compile_query.cache_clear()
+    _compile_combined_query.cache_clear()
+
+
+def make_function(name: str, start_line: int):
+    """Create a function object starting at the given line."""
+    return create_code_object(
+        name=name,
+        file_path="/repo/app.py",
+        relative_path="app.py",
+        object_type=ObjectType.FUNCTION,
+        start_line=start_line,
+        end_line=start_line + 1,
+    )
+
 
 class TestExtractorBasic:
     """Basic functionality tests for Extractor."""
@@ -71,6 +105,38 @@ def greet(name):
         assert result.objects[0].name == "greet"
         assert result.objects[0].object_type == ObjectType.FUNCTION
 
+    @pytest.mark.asyncio
+    async def test_extract_from_disk_matches_supplied_content(self, tmp_path):
+        """Test that reading a file yields the same objects as passing its content."""
+        code = 'class Greeter:\n    def hello(self):\n        return "안녕하세요"\n'
+        file_path = tmp_path / "greeter.py"
+        file_path.write_text(code, encoding="utf-8")
+        extractor = Extractor(PF())
+
+        from_disk = await extractor.extract_from_file(str(file_path))
+        from_content = await extractor.extract_from_file(str(file_path), content=code)
+
+        assert [(o.name, o.content) for o in from_disk.objects] == [
+            (o.name, o.content) for o in from_content.objects
+        ]
+
+    @pytest.mark.asyncio
+    async def test_extract_from_disk_translates_line_endings(self, tmp_path):
+        """Test that CRLF and CR files yield the same objects as LF content."""
+        code = "class Shape:\n    def area(self):\n        return 1\n"
+        extractor = Extractor(PF())
+        expected = await extractor.extract_from_file("shape.py", content=code)
+
+        for newline in ("\r\n", "\r"):
+            file_path = tmp_path / "shape.py"
+            file_path.write_bytes(code.replace("\n", newline).encode("utf-8"))
+
+            from_disk = await extractor.extract_from_file(str(file_path))
+
+            assert [(o.name, o.content, o.checksum) for o in from_disk.objects] == [
+                (o.name, o.content, o.checksum) for o in expected.objects
+            ]
+
 
 class TestExtractorRelationships:
     """Tests for relationship extraction."""
@@ -126,6 +192,25 @@ def main():
         calls_rels = [r for r in result.relationships if r.relation_type == RelationType.CALLS]
         assert len(calls_rels) >= 1
 
+    @pytest.mark.asyncio
+    async def test_repeated_calls_reported_once(self):
+        """Test that repeated calls between the same pair yield one relationship."""
+        code = """
+def helper():
+    pass
+
+def main():
+    helper()
+    helper()
+    helper()
+"""
+        extractor = Extractor(PF())
+
+        result = await extractor.extract_from_file("test.py", content=code)
+
+        calls_rels = [r for r in result.relationships if r.relation_type == RelationType.CALLS]
+        assert [(r.source_name, r.target_name) for r in calls_rels] == [("main", "helper")]
+
     @pytest.mark.asyncio
     async def test_references_relationship(self):
         """Test REFERENCES relationship extraction."""
@@ -194,27 +279,48 @@ class TestExtractorOptimization:
 
     @pytest.mark.asyncio
     async def test_query_cursor_caching(self):
-        """Test that QueryCursor objects are cached."""
-        factory = PF()
-        extractor = Extractor(factory)
-
-        # Initially, cache should be empty
-        assert len(extractor._query_cache) == 0
+        """Test that compiled queries are shared across Extractor instances."""
+        clear_query_caches()
 
         # Extract from a Python file
         code = "class Foo:\n    pass"
-        await extractor.extract_from_file("test.py", content=code)
+        await Extractor(PF()).extract_from_file("test.py", content=code)
 
-        # After extraction, cache should contain QueryCursor objects
-        assert len(extractor._query_cache) > 0
+        # After extraction, cache should contain compiled Query objects
+        cache_size_before = _compile_query.cache_info().currsize
+        assert cache_size_before > 0
 
-        # Extract from another Python file
+        # Extract from another Python file with a new extractor and factory
         code2 = "class Bar:\n    pass"
-        cache_size_before = len(extractor._query_cache)
-        await extractor.extract_from_file("test2.py", content=code2)
+        await Extractor(PF()).extract_from_file("test2.py", content=code2)
 
         # Cache size should remain the same (queries reused)
-        assert len(extractor._query_cache) == cache_size_before
+        assert _compile_query.cache_info().currsize == cache_size_before
+
+    def test_queries_are_compiled_at_init(self):
+        """Test that relationship and import queries are compiled before any file."""
+        clear_query_caches()
+
+        extractor = Extractor(PF())
+        compiled = _compile_query.cache_info().currsize
+
+        assert compiled >= len(_RELATIONSHIP_PATTERNS)
+        extractor._extract_uncached("test.py", "import os\nclass Foo:\n    pass")
+        assert _compile_query.cache_info().currsize == compiled
+
+    @pytest.mark.asyncio
+    async def test_query_cursors_are_pooled(self):
+        """Test that query cursors are returned to the pool and reused."""
+        extractor = Extractor(PF())
+        code = "class Foo:\n    def run(self):\n        pass"
+
+        await extractor.extract_from_file("test.py", content=code)
+        pooled = {key: list(cursors) for key, cursors in _cursor_pool.items()}
+        await extractor.extract_from_file("test2.py", content=code)
+
+        assert pooled
+        assert all(len(cursors) == 1 for cursors in _cursor_pool.values())
+        assert all(_cursor_pool[key] == deque(cursors) for key, cursors in pooled.items())
 
     @pytest.mark.asyncio
     async def test_single_pass_extraction(self):
@@ -238,6 +344,124 @@ def main():
 
         # This proves single-pass works because we got both in one extraction
 
+    @pytest.mark.asyncio
+    async def test_relationships_are_slotted(self):
+        """Test that relationships carry no per-instance __dict__."""
+        code = "class Dog:\n    def bark(self):\n        pass\n"
+
+        result = await Extractor(PF()).extract_from_file("test.py", content=code)
+
+        assert not hasattr(result.relationships[0], "__dict__")
+
+    @pytest.mark.asyncio
+    async def test_walked_up_contexts_are_resolved_once(self):
+        """Test that nodes sharing a definition resolve its context only once."""
+        code = """
+interface Runnable {}
+interface Closeable {}
+
+class Task implements Runnable, Closeable {}
+"""
+        extractor = Extractor(PF())
+
+        with patch.object(
+            extractor, "_resolve_context", wraps=extractor._resolve_context
+        ) as resolve:
+            result = await extractor.extract_from_file("Task.java", content=code)
+
+        implements = [r for r in result.relationships if r.relation_type == RelationType.IMPLEMENTS]
+        assert sorted(r.target_name for r in implements) == ["Closeable", "Runnable"]
+        assert resolve.call_count == 1
+
+    def test_relationship_patterns_capture_relation_types(self):
+        """Test that combined relationship patterns capture relation type names."""
+        captures = {
+            capture
+            for pattern in _RELATIONSHIP_PATTERNS["python"]
+            for capture in re.findall(r"@(\w+)", pattern)
+        }
+
+        assert captures == {"calls", "extends"}
+
+    @pytest.mark.asyncio
+    async def test_references_skip_call_sites_and_unknown_names(self):
+        """Test that walked references only cover known names outside calls."""
+        code = """
+def helper():
+    pass
+
+def main():
+    callback = helper
+    helper()
+    return unknown
+"""
+        extractor = Extractor(PF())
+
+        result = await extractor.extract_from_file("test.py", content=code)
+
+        refs = [r for r in result.relationships if r.relation_type == RelationType.REFERENCES]
+        assert [(r.source_name, r.target_name, r.source_line) for r in refs] == [
+            ("main", "helper", 5)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_invalid_pattern_does_not_disable_other_relationships(self):
+        """Test that a pattern rejected by the grammar only drops that pattern."""
+        code = """
+function helper() { return 1; }
+function main() { return helper(); }
+"""
+        extractor = Extractor(PF())
+
+        result = await extractor.extract_from_file("test.js", content=code)
+
+        calls = [r for r in result.relationships if r.relation_type == RelationType.CALLS]
+        assert [(r.source_name, r.target_name) for r in calls] == [("main", "helper")]
+
+    @pytest.mark.asyncio
+    async def test_context_is_innermost_enclosing_definition(self):
+        """Test that sources resolve to the innermost enclosing definition.
+
+        Nested functions are not extracted, so references inside them have no
+        source and are skipped rather than attributed to the outer method.
+        """
+        code = """
+def target():
+    pass
+
+class Outer:
+    def method(self):
+        def inner():
+            return target
+        return target
+
+def after():
+    return target
+"""
+        extractor = Extractor(PF())
+
+        result = await extractor.extract_from_file("test.py", content=code)
+
+        refs = [r for r in result.relationships if r.relation_type == RelationType.REFERENCES]
+        assert sorted((r.source_name, r.source_line) for r in refs) == [
+            ("after", 11),
+            ("method", 6),
+        ]
+
+    def test_indexed_target_selection_matches_loop(self):
+        """Test that bisect-based target selection picks the same candidate as the loop."""
+        extractor = Extractor(PF())
+        lines = [*range(3, 400, 10), 203, 203, 57]
+        candidates = [make_function("run", line) for line in lines]
+        index = _TargetIndex.build(candidates)
+        source = make_function("main", 200)
+
+        for ref_line in range(0, 420):
+            node = SimpleNamespace(start_point=(ref_line - 1, 0))
+            assert extractor._select_best_target(
+                node, source, candidates, index
+            ) is extractor._select_best_target(node, source, candidates)
+
 
 class TestExtractorEdgeCases:
     """Tests for edge cases and error handling."""
@@ -298,33 +522,19 @@ def main():
         # Relationships to undefined targets should be skipped
         # (no crash, graceful handling)
 
-
-class TestExtractorBatch:
-    """Tests for batch extraction."""
-
     @pytest.mark.asyncio
-    async def test_extract_batch_multiple_files(self, tmp_path):
-        """Test batch extraction from multiple files."""
-        # Create test files
-        file1 = tmp_path / "file1.py"
-        file1.write_text("class Foo:\n    pass")
-
-        file2 = tmp_path / "file2.py"
-        file2.write_text("class Bar:\n    pass")
-
-        factory = PF()
-        extractor = Extractor(factory)
-
-        # Extract from batch
-        file_paths = [str(file1), str(file2)]
-        results = []
-        async for batch_result in extractor.extract_batch(file_paths, batch_size=2):
-            results.append(batch_result)
-
-        # Should have one batch with both files
-        assert len(results) == 1
-        batch = results[0]
-
-        # Should extract objects from both files
-        assert len(batch.objects) == 2
-        assert {obj.name for obj in batch.objects} == {"Foo", "Bar"}
+    async def test_large_tree_skips_references(self):
+        """Test that trees above max_reference_nodes keep calls but skip references."""
+        code = "def helper():\n    pass\n\ndef main():\n    callback = helper\n    helper()\n"
+
+        full = await Extractor(PF()).extract_from_file("test.py", content=code)
+        capped = await Extractor(PF(ParserConfig(max_reference_nodes=10))).extract_from_file(
+            "test.py", content=code
+        )
+
+        assert {r.relation_type for r in full.relationships} >= {
+            RelationType.CALLS,
+            RelationType.REFERENCES,
+        }
+        assert RelationType.REFERENCES not in {r.relation_type for r in capped.relationships}
+        assert RelationType.CALLS in {r.relation_type for r in capped.relationships}
@@ -7,7 +7,9 @@ git changes and updates only modified files in the index.
 from unittest.mock import Mock
 
 import pytest
+from codecontext.config.schema import Config, ParsingConfig
 from codecontext.indexer.sync import IncrementalIndexStrategy
+from codecontext.utils.checksum import calculate_file_checksum
 from codecontext.utils.git_ops import GitOperations
 
 
@@ -39,6 +41,7 @@ def mock_config():
     # Add streaming config
     config.indexing.streaming = Mock()
     config.indexing.streaming.chunk_size = 100
+    config.indexing.parsing = ParsingConfig()
     return config
 
 
@@ -191,12 +194,28 @@ class TestGitChangeDetection:
 class TestIncrementalSync:
     """Test incremental sync logic.
 
-    DELETED: These tests were testing implementation details with brittle mocks
-    that don't match the current checksum-based incremental sync implementation.
-    Integration tests cover the actual end-to-end behavior.
+    End-to-end behavior is covered by the integration tests; this class only
+    checks change detection against mocked storage.
     """
 
-    pass  # All tests removed
+    async def test_detect_changes_batches_checksum_lookups(self, mock_storage, tmp_path):
+        """Should look up stored checksums in one batch per file kind, not per file."""
+        (tmp_path / "main.py").write_text("print('hi')\n")
+        (tmp_path / "README.md").write_text("# Readme\n")
+        (tmp_path / "guide.md").write_text("# Guide\n")
+        mock_storage.get_file_checksums_batch = Mock(
+            return_value={
+                str(tmp_path / "guide.md"): calculate_file_checksum(tmp_path / "guide.md")
+            }
+        )
+        sync = IncrementalIndexStrategy(Config(), Mock(), mock_storage)
+
+        changed_code, changed_docs = await sync._detect_changes(tmp_path)
+
+        assert changed_code == [tmp_path / "main.py"]
+        assert changed_docs == [tmp_path / "README.md"]
+        assert mock_storage.get_file_checksums_batch.call_count == 2
+        mock_storage.get_file_checksum.assert_not_called()
 
 
 class TestSyncIntegration:
@@ -0,0 +1,547 @@
+"""Tests for the chunked indexing strategy.
+
+Tests the AsyncIndexStrategy class from indexer.strategy module.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from codecontext.config.schema import Config
+from codecontext.indexer.extractor import ImportInfo
+from codecontext.indexer.strategy import AsyncIndexStrategy
+from codecontext_core.exceptions import EmbeddingError
+from codecontext_core.models import DocumentNode, NodeType, ObjectType, RelationType
+
+from tests.fixtures.factories import create_calls_relationship, create_code_object
+
+
+def make_document(content: str) -> DocumentNode:
+    """Create a markdown document node with the given content."""
+    return DocumentNode(
+        file_path="/repo/doc.md",
+        relative_path="doc.md",
+        node_type=NodeType.MARKDOWN,
+        content=content,
+        checksum="checksum",
+    )
+
+
+@pytest.fixture
+def translator():
+    """Mock translation provider that tags translated text and records batches."""
+    provider = Mock()
+    provider.batches = []
+    provider.get_batch_size = Mock(return_value=2)
+
+    async def translate_stream(chunks, source_lang, target_lang="en", *, progress=None):
+        async for batch in chunks:
+            provider.batches.append((source_lang, batch))
+            yield [f"[{source_lang}] {text}" for text in batch]
+
+    provider.translate_stream = translate_stream
+    return provider
+
+
+@pytest.fixture
+def strategy(translator):
+    """Create a strategy with two workers and a mock translator."""
+    config = Config()
+    config.indexing.parallel_workers = 2
+    strategy = AsyncIndexStrategy(config, Mock(), Mock(), translation_provider=translator)
+    # langdetect is non-deterministic on short text; detect by script instead
+    strategy.language_detector = Mock()
+    strategy.language_detector.detect = Mock(
+        side_effect=lambda t: "en" if t.isascii() else ("ja" if "の" in t else "ko")
+    )
+    return strategy
+
+
+class TestConcurrency:
+    """Test the extraction concurrency chosen at construction."""
+
+    @pytest.mark.parametrize(("cpu_count", "expected"), [(1, 1), (6, 3), (32, 8)])
+    def test_auto_detects_from_cpu_count(self, cpu_count, expected):
+        """Should use half the CPUs, at least one and at most eight."""
+        config = Config()
+        config.indexing.parallel_workers = 0
+
+        with patch("os.cpu_count", return_value=cpu_count):
+            strategy = AsyncIndexStrategy(config, Mock(), Mock())
+
+        assert strategy._max_concurrency == expected
+
+
+class TestTranslateDocuments:
+    """Test document translation before embedding."""
+
+    async def test_translates_only_non_english_documents(self, strategy):
+        """Should translate non-English content and keep the original in metadata."""
+        korean = make_document("사용자 인증 모듈은 토큰을 검증합니다")
+        english = make_document("The authentication module validates tokens")
+        empty = make_document("   ")
+
+        documents = await strategy._translate_documents([korean, english, empty], False)
+
+        assert documents == [korean, english, empty]
+        assert korean.content == "[ko] 사용자 인증 모듈은 토큰을 검증합니다"
+        assert korean.metadata == {
+            "original_text": "사용자 인증 모듈은 토큰을 검증합니다",
+            "original_lang": "ko",
+        }
+        assert english.content == "The authentication module validates tokens"
+        assert "original_text" not in english.metadata
+        assert empty.content == "   "
+
+    async def test_failed_translation_keeps_original(self, strategy, translator):
+        """Should leave documents untouched when their translation fails."""
+
+        async def failing_stream(chunks, source_lang, target_lang="en", *, progress=None):
+            raise RuntimeError("model unavailable")
+            yield []
+
+        translator.translate_stream = failing_stream
+        document = make_document("사용자 인증 모듈은 토큰을 검증합니다")
+
+        await strategy._translate_documents([document], False)
+
+        assert document.content == "사용자 인증 모듈은 토큰을 검증합니다"
+        assert document.metadata == {}
+
+    async def test_batches_documents_per_source_language(self, strategy, translator):
+        """Should translate each language in provider-sized batches, in document order."""
+        texts = ["한국어 하나", "日本語のテキスト", "한국어 둘", "English text", "한국어 셋"]
+        documents = [make_document(text) for text in texts]
+
+        await strategy._translate_documents(documents, False)
+
+        assert translator.batches == [
+            ("ko", ["한국어 하나", "한국어 둘"]),
+            ("ko", ["한국어 셋"]),
+            ("ja", ["日本語のテキスト"]),
+        ]
+        assert [doc.content for doc in documents] == [
+            "[ko] 한국어 하나",
+            "[ja] 日本語のテキスト",
+            "[ko] 한국어 둘",
+            "English text",
+            "[ko] 한국어 셋",
+        ]
+
+
+class TestSetParentIds:
+    """Test resolving parent UUIDs to deterministic ids."""
+
+    def test_resolves_uuid_parents_within_chunk(self, strategy):
+        """Should map UUID parents in the chunk and leave other parents alone."""
+        parent = create_code_object("Shape", "/repo/a.py", "a.py", ObjectType.CLASS)
+        child = create_code_object("area", "/repo/a.py", "a.py", ObjectType.METHOD)
+        orphan = create_code_object("draw", "/repo/a.py", "a.py", ObjectType.METHOD)
+        preset = create_code_object("size", "/repo/a.py", "a.py", ObjectType.METHOD)
+        child.parent_id = parent.id
+        orphan.parent_id = uuid4()
+        preset.parent_id = preset.parent_deterministic_id = "existing-parent"
+
+        strategy._set_parent_ids([parent, child, orphan, preset])
+
+        assert child.parent_deterministic_id == parent.deterministic_id
+        assert orphan.parent_deterministic_id is None
+        assert preset.parent_deterministic_id == "existing-parent"
+        assert parent.parent_deterministic_id is None
+
+
+class TestResolveImportRelationships:
+    """Test linking import statements to indexed objects."""
+
+    def test_matches_module_path_and_imported_names(self, strategy):
+        """Should link the importing file to objects in the module and by name."""
+        importer = create_code_object("main", "/repo/app.py", "app.py", ObjectType.FUNCTION)
+        shape = create_code_object(
+            "Shape", "/repo/geo/shapes.py", "geo/shapes.py", ObjectType.CLASS
+        )
+        area = create_code_object(
+            "area", "/repo/geo/shapes.py", "geo/shapes.py", ObjectType.FUNCTION
+        )
+        helper = create_code_object("Helper", "/repo/util.py", "util.py", ObjectType.CLASS)
+        imports = [
+            ImportInfo(imported_name="geo.shapes", source_file="app.py"),
+            ImportInfo(imported_name="Helper", source_file="app.py"),
+            ImportInfo(imported_name="Shape", source_file="missing.py"),
+        ]
+
+        relationships = strategy._resolve_import_relationships(
+            imports, [importer, shape, area, helper]
+        )
+
+        assert [(r.source_name, r.target_name) for r in relationships] == [
+            ("main", "Shape"),
+            ("main", "area"),
+            ("main", "Helper"),
+        ]
+        assert {r.relation_type for r in relationships} == {RelationType.IMPORTS}
+
+    def test_matches_each_imported_name_once(self, strategy):
+        """Should reuse the match of a name imported from several files."""
+        first = create_code_object("main", "/repo/app.py", "app.py", ObjectType.FUNCTION)
+        second = create_code_object("run", "/repo/cli.py", "cli.py", ObjectType.FUNCTION)
+        helper = create_code_object("Helper", "/repo/util.py", "util.py", ObjectType.CLASS)
+        imports = [
+            ImportInfo(imported_name="Helper", source_file="app.py"),
+            ImportInfo(imported_name="Helper", source_file="cli.py"),
+        ]
+
+        with patch.object(
+            strategy, "_match_import_to_objects", wraps=strategy._match_import_to_objects
+        ) as match:
+            relationships = strategy._resolve_import_relationships(imports, [first, second, helper])
+
+        match.assert_called_once()
+        assert [(r.source_name, r.target_name) for r in relationships] == [
+            ("main", "Helper"),
+            ("run", "Helper"),
+        ]
+
+    def test_match_returns_each_object_once(self, strategy):
+        """Should drop objects matched both by name and by module path."""
+        shape = create_code_object("Shape", "/repo/geo.py", "geo.py", ObjectType.CLASS)
+        area = create_code_object("area", "/repo/geo.py", "geo.py", ObjectType.FUNCTION)
+
+        matched = strategy._match_import_to_objects(
+            "geo.Shape", {"Shape": [shape]}, {"geo.Shape": [shape, area]}
+        )
+
+        assert matched == [shape, area]
+
+
+class TestLinkRelationships:
+    """Test cross-file and reverse relationship generation."""
+
+    def test_duplicate_imports_get_one_reverse(self, strategy):
+        """Should keep one IMPORTS edge per pair and reverse it once."""
+        importer = create_code_object("main", "/repo/app.py", "app.py", ObjectType.FUNCTION)
+        helper = create_code_object("Helper", "/repo/util.py", "util.py", ObjectType.CLASS)
+        imports = [
+            ImportInfo(imported_name="Helper", source_file="app.py"),
+            ImportInfo(imported_name="util.Helper", source_file="app.py"),
+        ]
+
+        relationships = strategy._link_relationships([importer, helper], [], imports)
+
+        assert [(r.source_name, r.target_name, r.relation_type) for r in relationships] == [
+            ("main", "Helper", RelationType.IMPORTS),
+            ("Helper", "main", RelationType.IMPORTED_BY),
+        ]
+
+
+@pytest.fixture
+def embedder():
+    """Mock embedding provider that records every text it embeds."""
+    provider = Mock()
+    provider.embedded = []
+    provider.get_batch_size = Mock(return_value=2)
+
+    async def embed_stream(chunks, *, progress=None):
+        async for batch in chunks:
+            provider.embedded.extend(batch)
+            yield [[float(len(text))] for text in batch]
+
+    provider.embed_stream = embed_stream
+    return provider
+
+
+def make_embedding_strategy(embedder, dedupe_cache=True):
+    """Create a strategy that embeds with the given provider."""
+    config = Config()
+    config.embeddings.dedupe_cache = dedupe_cache
+    return AsyncIndexStrategy(config, embedder, Mock())
+
+
+class TestEmbed:
+    """Test embedding generation for code objects and documents."""
+
+    async def test_identical_texts_are_embedded_once(self, embedder):
+        """Should embed repeated content once and share the result."""
+        strategy = make_embedding_strategy(embedder)
+        objects = [
+            create_code_object(name, "/repo/a.py", "a.py", ObjectType.METHOD, content=content)
+            for name, content in [("a", "pass"), ("b", "return 1"), ("c", "pass")]
+        ]
+
+        await strategy._embed(objects, show_progress=False)
+
+        instruction = strategy.config.embeddings.huggingface.instructions.nl2code_passage
+        assert embedder.embedded == [instruction + "pass", instruction + "return 1"]
+        assert objects[0].embedding == objects[2].embedding == [float(len(instruction + "pass"))]
+        assert objects[1].embedding == [float(len(instruction + "return 1"))]
+
+    async def test_short_provider_batch_raises(self, embedder):
+        """Should fail instead of assigning later embeddings to the wrong texts."""
+
+        async def embed_stream(chunks, *, progress=None):
+            async for batch in chunks:
+                yield [[float(len(text))] for text in batch[:1]]
+
+        embedder.embed_stream = embed_stream
+        strategy = make_embedding_strategy(embedder)
+        objects = [
+            create_code_object(name, "/repo/a.py", "a.py", ObjectType.METHOD, content=name)
+            for name in ("a", "bb", "ccc")
+        ]
+
+        with pytest.raises(EmbeddingError, match="returned 1 embeddings for a batch of 2"):
+            await strategy._embed(objects, show_progress=False)
+
+    async def test_cache_is_reused_across_calls(self, embedder):
+        """Should serve texts embedded by an earlier call from the cache."""
+        strategy = make_embedding_strategy(embedder)
+        first = [make_document("## Setup\nrun it")]
+        second = [make_document("## Setup\nrun it"), make_document("## Usage\nimport it")]
+
+        await strategy._embed_documents(first, show_progress=False)
+        await strategy._embed_documents(second, show_progress=False)
+
+        assert len(embedder.embedded) == 2
+        assert second[0].embedding == first[0].embedding
+
+    async def test_disabled_cache_embeds_every_text(self, embedder):
+        """Should send duplicates to the provider when the cache is disabled."""
+        strategy = make_embedding_strategy(embedder, dedupe_cache=False)
+        documents = [make_document("same"), make_document("same"), make_document("same")]
+
+        await strategy._embed_documents(documents, show_progress=False)
+
+        assert len(embedder.embedded) == 3
+        assert all(doc.embedding is not None for doc in documents)
+
+
+class TestExtractFiles:
+    """Test concurrent extraction of a chunk of files."""
+
+    async def test_collects_every_extracted_file(self, embedder, tmp_path):
+        """Should gather objects from all files and skip ones that fail to extract."""
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.py"
+            path.write_text(f"def {name}():\n    pass\n")
+            paths.append(path)
+        strategy = make_embedding_strategy(embedder)
+
+        objects, _, _ = await strategy._extract_files([*paths, tmp_path / "missing.py"])
+
+        assert sorted(obj.name for obj in objects) == ["a", "b", "c"]
+
+    async def test_persistent_cache_is_reused_across_runs(self, embedder, tmp_path):
+        """Should serve texts embedded by an earlier strategy from the database."""
+        config = Config()
+        config.embeddings.persistent_cache = True
+
+        with patch("codecontext.indexer.strategy.get_data_dir", return_value=tmp_path):
+            first = AsyncIndexStrategy(config, embedder, Mock())
+            second = AsyncIndexStrategy(config, embedder, Mock())
+        await first._embed_documents([make_document("## Setup")], show_progress=False)
+        documents = [make_document("## Setup")]
+        await second._embed_documents(documents, show_progress=False)
+
+        assert len(embedder.embedded) == 1
+        assert documents[0].embedding == [float(len(embedder.embedded[0]))]
+
+    @pytest.mark.parametrize(
+        ("setting", "value"),
+        [
+            ("max_reference_nodes", 1_000),
+            ("partial_parse_threshold", 0.9),
+            ("enable_error_recovery", False),
+            ("timeout_micros", 100_000),
+        ],
+    )
+    async def test_extraction_cache_is_keyed_by_parse_settings(
+        self, embedder, tmp_path, setting, value
+    ):
+        """Should not serve results extracted under different parse settings."""
+        file_path = tmp_path / "shapes.py"
+        file_path.write_text("class Shape:\n    def area(self):\n        pass\n")
+        config = Config()
+        config.indexing.parsing.enable_extraction_cache = True
+
+        with patch("codecontext.indexer.strategy.get_data_dir", return_value=tmp_path):
+            first = AsyncIndexStrategy(config, embedder, Mock())
+            setattr(config.indexing.parsing, setting, value)
+            second = AsyncIndexStrategy(config, embedder, Mock())
+        await first._extract_files([file_path])
+
+        with patch.object(
+            second.extractor, "_extract_uncached", wraps=second.extractor._extract_uncached
+        ) as extract:
+            await second._extract_files([file_path])
+
+        extract.assert_called_once()
+
+
+class TestProcessCodeChunk:
+    """Test extraction, embedding and storage of one chunk of code files."""
+
+    async def test_reuses_stored_embeddings(self, embedder, tmp_path):
+        """Should reuse embeddings of stored objects and embed only the new ones."""
+        file_path = tmp_path / "shapes.py"
+        file_path.write_text("class Shape:\n    def area(self):\n        pass\n")
+        strategy = make_embedding_strategy(embedder)
+        objects, _, _ = await strategy._extract_files([file_path])
+        stored = next(obj for obj in objects if obj.name == "Shape")
+        stored.embedding = [0.5]
+        strategy.storage.get_code_objects_batch = Mock(return_value=[stored])
+
+        stats = await strategy._process_code_chunk([file_path], 0, False, reuse_embeddings=True)
+
+        strategy.storage.get_code_objects_batch.assert_called_once()
+        assert (stats.embeddings_generated, stats.embeddings_reused) == (1, 1)
+        assert len(embedder.embedded) == 1
+        stored_objects = strategy.storage.add_code_objects.call_args.args[0]
+        assert {obj.name: obj.embedding for obj in stored_objects}["Shape"] == [0.5]
+
+    async def test_stores_each_batch_once_embedded(self, embedder):
+        """Should write storage-sized batches whose objects are already embedded."""
+        strategy = make_embedding_strategy(embedder)
+        strategy.config.indexing.batch_size = 2
+        stored = []
+        strategy.storage.add_code_objects = Mock(
+            side_effect=lambda batch, rels: stored.append([obj.embedding for obj in batch])
+        )
+        objects = [
+            create_code_object(name, "/repo/a.py", "a.py", ObjectType.FUNCTION, content=name)
+            for name in ("a", "bb", "ccc")
+        ]
+        objects[1].embedding = [0.5]
+
+        generated = await strategy._embed_and_store(objects, [], show_progress=False)
+
+        instruction = strategy.config.embeddings.huggingface.instructions.nl2code_passage
+        assert generated == 2
+        assert stored == [
+            [[float(len(instruction + "a"))], [0.5]],
+            [[float(len(instruction + "ccc"))]],
+        ]
+
+    async def test_embeds_in_provider_batches_with_own_relationships(self, embedder):
+        """Should fill each batch up to the provider batch size and pass only its relationships."""
+        strategy = make_embedding_strategy(embedder)
+        objects = [
+            create_code_object(name, "/repo/a.py", "a.py", ObjectType.FUNCTION, content=name)
+            for name in ("a", "bb", "ccc", "dddd")
+        ]
+        objects[1].embedding = [0.5]
+        ids = {obj.name: obj.deterministic_id for obj in objects}
+        names = {obj.deterministic_id: obj.name for obj in objects}
+        relationships = [
+            create_calls_relationship(ids[source], ids[target])
+            for source, target in [("a", "bb"), ("ccc", "dddd"), ("dddd", "dddd")]
+        ]
+        stored = []
+        strategy.storage.add_code_objects = Mock(
+            side_effect=lambda batch, rels: stored.append(
+                (
+                    [obj.name for obj in batch],
+                    [(names[rel.source_id], names[rel.target_id]) for rel in rels],
+                )
+            )
+        )
+
+        await strategy._embed_and_store(objects, relationships, show_progress=False)
+
+        assert stored == [
+            (["a", "bb", "ccc"], [("a", "bb"), ("ccc", "dddd")]),
+            (["dddd"], [("ccc", "dddd"), ("dddd", "dddd")]),
+        ]
+
+
+class TestProcessCodeFiles:
+    """Test chunked processing of code files."""
+
+    async def test_extracts_next_chunk_while_storing(self, embedder, tmp_path):
+        """Should extract the following chunk while the current one is stored."""
+        strategy = make_embedding_strategy(embedder)
+        strategy.embedding_provider.cleanup = AsyncMock()
+        strategy.config.indexing.file_chunk_size = 10
+        files = [tmp_path / f"m{i}.py" for i in range(25)]
+        events = []
+
+        async def extract_files(chunk_files):
+            events.append(f"extract {chunk_files[0].name}")
+            return [], [], []
+
+        async def embed_and_store(objects, relationships, show_progress):
+            events.append("store start")
+            await asyncio.sleep(0.01)
+            events.append("store end")
+            return 0
+
+        strategy._extract_files = extract_files
+        strategy._embed_and_store = embed_and_store
+
+        stats = await strategy.process_code_files(files, show_progress=False)
+
+        assert stats.total_chunks == 3
+        assert events == [
+            "extract m0.py",
+            "store start",
+            "extract m10.py",
+            "store end",
+            "store start",
+            "extract m20.py",
+            "store end",
+            "store start",
+            "store end",
+        ]
+
+    async def test_cancels_next_extraction_on_failure(self, embedder, tmp_path):
+        """Should stop the extraction running ahead before a storage error propagates."""
+        strategy = make_embedding_strategy(embedder)
+        strategy.embedding_provider.cleanup = AsyncMock()
+        strategy.config.indexing.file_chunk_size = 10
+        files = [tmp_path / f"m{i}.py" for i in range(20)]
+        events = []
+
+        async def extract_files(chunk_files):
+            try:
+                await asyncio.sleep(0 if chunk_files[0].name == "m0.py" else 10)
+            except asyncio.CancelledError:
+                events.append(f"cancelled {chunk_files[0].name}")
+                raise
+            return [], [], []
+
+        async def embed_and_store(objects, relationships, show_progress):
+            await asyncio.sleep(0)
+            raise RuntimeError("storage down")
+
+        strategy._extract_files = extract_files
+        strategy._embed_and_store = embed_and_store
+
+        with pytest.raises(RuntimeError, match="storage down"):
+            await strategy.process_code_files(files, show_progress=False)
+
+        assert events == ["cancelled m10.py"]
+
+
+class TestStoreDocuments:
+    """Test batched document storage."""
+
+    async def test_writes_every_batch(self, embedder):
+        """Should store all documents in batch_size batches."""
+        strategy = make_embedding_strategy(embedder)
+        strategy.config.indexing.batch_size = 32
+        documents = [make_document(f"section {i}") for i in range(70)]
+
+        await strategy._store_documents(documents, show_progress=False)
+
+        batches = [call.args[0] for call in strategy.storage.add_documents.call_args_list]
+        assert sorted(len(batch) for batch in batches) == [6, 32, 32]
+        assert {id(doc) for batch in batches for doc in batch} == {id(doc) for doc in documents}
+
+    def test_embedded_storage_uses_one_writer(self, embedder):
+        """Should only write concurrently to a Qdrant server."""
+        strategy = make_embedding_strategy(embedder)
+        strategy.config.indexing.storage_concurrency = 3
+
+        assert strategy._get_storage_concurrency() == 1
+        strategy.config.storage.qdrant.mode = "remote"
+        assert strategy._get_storage_concurrency() == 3
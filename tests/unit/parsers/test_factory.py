@@ -45,3 +45,8 @@ class TestParserFactory:
         parser = factory.get_parser_by_language(Language.KOTLIN)
         assert parser is not None
         assert parser.get_language() == Language.KOTLIN
+
+    def test_ts_language_matches_parser_grammar(self, factory):
+        """Should expose the tree-sitter grammar of the cached parser."""
+        parser = factory.get_parser_by_language(Language.PYTHON)
+        assert factory.get_ts_language(Language.PYTHON) is parser.parser.ts_language
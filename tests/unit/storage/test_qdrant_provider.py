@@ -0,0 +1,54 @@
+"""Tests for Qdrant collection setup.
+
+Tests the QdrantProvider class from codecontext_storage_qdrant.provider module.
+"""
+
+from unittest.mock import Mock
+
+import pytest
+from codecontext.config.schema import FieldWeights, QdrantConfig
+from codecontext_storage_qdrant.provider import QdrantProvider
+from qdrant_client.models import Datatype, ScalarType
+
+
+def create_collection_kwargs(vector_dtype: str) -> dict:
+    """Create a collection with the given vector dtype and return the client call kwargs."""
+    provider = QdrantProvider(
+        QdrantConfig(vector_dtype=vector_dtype), "test_project", FieldWeights()
+    )
+    provider.client = Mock()
+    provider.vector_size = 768
+
+    provider._create_collection()
+
+    return provider.client.create_collection.call_args.kwargs
+
+
+class TestCreateCollection:
+    """Test dense vector storage precision."""
+
+    def test_float32_by_default(self):
+        """Should keep full precision vectors without quantization."""
+        kwargs = create_collection_kwargs("float32")
+
+        assert kwargs["vectors_config"]["dense"].datatype is None
+        assert kwargs["quantization_config"] is None
+
+    def test_float16_vectors(self):
+        """Should store dense vectors as float16."""
+        kwargs = create_collection_kwargs("float16")
+
+        assert kwargs["vectors_config"]["dense"].datatype == Datatype.FLOAT16
+        assert kwargs["quantization_config"] is None
+
+    def test_int8_quantization(self):
+        """Should add an int8 scalar-quantized copy of float32 vectors."""
+        kwargs = create_collection_kwargs("int8")
+
+        assert kwargs["vectors_config"]["dense"].datatype is None
+        assert kwargs["quantization_config"].scalar.type == ScalarType.INT8
+
+    def test_rejects_unknown_dtype(self):
+        """Should only accept supported vector dtypes."""
+        with pytest.raises(ValueError, match="vector_dtype"):
+            QdrantConfig(vector_dtype="float64")
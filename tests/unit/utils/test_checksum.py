@@ -149,6 +149,19 @@ class TestChecksumCalculatorFileChecksum:
         assert isinstance(result, str)
         assert len(result) == 16
 
+    def test_memory_mapped_file_matches_whole_content(self, tmp_path):
+        """Should hash a file large enough to be memory-mapped the same as its content."""
+        # Arrange
+        data = bytes(range(256)) * (5 * 1024 * 1024 // 256 + 7)
+        file_path = tmp_path / "large.bin"
+        file_path.write_bytes(data)
+
+        # Act
+        result = ChecksumCalculator.calculate_file_checksum(file_path)
+
+        # Assert
+        assert result == ChecksumCalculator.calculate_bytes_checksum(data)
+
     def test_raises_error_for_nonexistent_file(self):
         """Should raise OSError for nonexistent file."""
         # Arrange
@@ -7,8 +7,9 @@ import tempfile
 from pathlib import Path
 from unittest.mock import patch
 
+import pathspec
 import pytest
-from codecontext.utils.path_filter import PathFilter, create_path_filter
+from codecontext.utils.path_filter import PathFilter, compile_spec, create_path_filter
 
 # ======================================================================
 # Fixtures
@@ -507,6 +508,40 @@ class TestCreatePathFilter:
         assert filter.repository_path == temp_repo
 
 
+class TestCompileSpec:
+    """Test single-regex matching of gitwildmatch specs."""
+
+    def test_matches_like_pathspec(self):
+        """Should agree with pathspec on the default ignore patterns."""
+        spec = pathspec.PathSpec.from_lines("gitwildmatch", PathFilter.DEFAULT_IGNORE_PATTERNS)
+        match = compile_spec(spec)
+        paths = [
+            "src/main.py",
+            "module.pyc",
+            "a/b/__pycache__/m.py",
+            "node_modules/pkg/index.js",
+            "src/build.py",
+            "build/output.js",
+            ".coverage",
+            "docs/.coverage/index.md",
+        ]
+
+        assert [match(p) for p in paths] == [spec.match_file(p) for p in paths]
+
+    def test_empty_spec_matches_nothing(self):
+        """Should not match any path without patterns."""
+        match = compile_spec(pathspec.PathSpec.from_lines("gitwildmatch", ["# comment", ""]))
+
+        assert match("src/main.py") is False
+
+    def test_negation_keeps_pattern_order(self):
+        """Should let a later negation re-include a matched path."""
+        match = compile_spec(pathspec.PathSpec.from_lines("gitwildmatch", ["*.log", "!keep.log"]))
+
+        assert match("debug.log") is True
+        assert match("keep.log") is False
+
+
 class TestErrorHandling:
     """Test error handling scenarios."""
 